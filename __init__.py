@@ -0,0 +1,47 @@
+"""
+defnotdatatools package. Submodules (and the shortcuts below) are imported lazily, on first access,
+so eg `import defnotdatatools` then `defnotdatatools.timing.Timer()` never pays for pandas.
+
+For how to import, see defnotdatatools/README.md.
+"""
+
+
+
+# < Setup > ============================================================================
+
+import importlib
+
+
+
+# < Lazy submodules and shortcuts > ===============================================================
+
+SUBMODULES = ('bench', 'iact', 'misc', 'missing', 'sketch', 'timing')
+SHORTCUTS = {  # most frequently used names, available as defnotdatatools.<name>
+    'wit': 'iact',
+    'dir_str': 'iact',
+    'dir_doc': 'iact',
+    'df_summary': 'iact',
+    'df_full_info': 'iact',
+    'df_memory_info': 'iact',
+    'shrink_memory': 'iact',
+    'analyze_missingness': 'missing',
+    'tfrm_fill_median': 'missing',
+    'tfrm_fill_median_df': 'missing',
+    'Timer': 'timing',
+    'now_for_filename': 'timing',
+}
+
+__all__ = list(SUBMODULES) + list(SHORTCUTS)
+
+def __getattr__(name):
+    """Imports submodule (or the submodule holding a shortcut) the first time it's accessed"""
+    if name in SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name in SHORTCUTS:
+        value = getattr(importlib.import_module('.' + SHORTCUTS[name], __name__), name)
+        globals()[name] = value  # so later accesses skip __getattr__
+        return value
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,272 @@
+"""
+defnotdatatools.bench module is for benchmarking defnotdatatools itself: timing (and peak memory of)
+its main entry points on synthetic DataFrames of various sizes and shapes, saving the results keyed
+by git hash, and comparing them against a baseline to catch slowdowns before a nightly job does.
+
+Run from the command line, eg (from the parent dir of defnotdatatools):
+    python -m defnotdatatools.bench --save-dir bench_results --baseline bench_results/bench_abc123.json
+
+For how to import, see defnotdatatools/README.md.
+"""
+
+
+
+# < Setup > ============================================================================
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from . import iact, misc, missing, timing
+
+
+
+# < Constants > ===============================================================
+
+BENCH_ROWS = (10 ** 3, 10 ** 5, 10 ** 6)  # pass rows up to 10 ** 8 to bench_cases() for the big runs
+BENCH_NCOLS = (10, 100)
+BENCH_DTYPE_MIXES = (('float',), ('float', 'int', 'object'))
+BENCH_NAN_FRACS = (0., .3)
+BENCH_CARDINALITIES = (10, 100000)
+BENCH_REPEAT = 3
+REGRESSION_TIME_THRESHOLD = .2  # ie 20% slower than baseline is a regression
+REGRESSION_MEMORY_THRESHOLD = .2
+REGRESSION_MIN_SECS = .01  # changes smaller than this are noise, whatever the %
+
+ENTRY_POINTS = OrderedDict([
+    ('cols_info_float', lambda df: iact.cols_info_float(df)),
+    ('cols_info_other', lambda df: iact.cols_info_other(df)),
+    ('df_full_info', lambda df: iact.df_full_info(df).compute_all()),
+    ('tfrm_fill_median', lambda df: df.apply(missing.tfrm_fill_median)),
+    ('tfrm_fill_median_df', lambda df: missing.tfrm_fill_median_df(df)),
+])
+
+IMPORT_MAX_SECS = OrderedDict([('', .02), ('timing', .02), ('misc', .02)])  # '' is the package itself
+IMPORT_HEAVY_MODULES = ('numpy', 'pandas', 'asyncio', 'multiprocessing')  # mustn't be imported by those
+IMPORT_REPEAT = 5
+
+
+
+# < Synthetic data > ===============================================================
+
+def bench_cases(rows=BENCH_ROWS, ncols=BENCH_NCOLS, dtype_mixes=BENCH_DTYPE_MIXES,
+                nan_fracs=BENCH_NAN_FRACS, cardinalities=BENCH_CARDINALITIES):
+    """Returns list of dicts of make_frame() args, one per combination of the passed values"""
+    return [OrderedDict([('nrows', nrows), ('ncols', ncols_), ('dtype_mix', dtype_mix),
+                         ('nan_frac', nan_frac), ('cardinality', cardinality)])
+            for nrows, ncols_, dtype_mix, nan_frac, cardinality
+            in itertools.product(rows, ncols, dtype_mixes, nan_fracs, cardinalities)]
+
+def make_frame(nrows, ncols, dtype_mix=('float',), nan_frac=0., cardinality=100, seed=0):
+    """
+    Returns synthetic DataFrame: ncols cols cycling through dtype_mix ('float' | 'int' |
+    'object' | 'category' | 'bool' | 'datetime'), with about nan_frac of float and object values
+    NaN, and values drawn from cardinality distinct ones.
+    """
+    rng = np.random.default_rng(seed)
+    cols = OrderedDict()
+    for i in range(ncols):
+        dtype = dtype_mix[i % len(dtype_mix)]
+        codes = rng.integers(0, cardinality, nrows)
+        if dtype == 'float':
+            ser = pd.Series(codes * rng.normal(), dtype=np.float64)
+        elif dtype == 'int':
+            ser = pd.Series(codes, dtype=np.int64)
+        elif dtype in ('object', 'category'):
+            ser = pd.Series(np.char.add('v', codes.astype(str)).astype(object))
+            if dtype == 'category':
+                ser = ser.astype('category')
+        elif dtype == 'bool':
+            ser = pd.Series(codes % 2 == 0)
+        elif dtype == 'datetime':
+            ser = pd.Series(pd.Timestamp('2000-01-01') + pd.to_timedelta(codes, unit='s'))
+        else:
+            raise ValueError('Unknown dtype in dtype_mix: ' + dtype)
+        if nan_frac > 0 and dtype in ('float', 'object'):
+            ser[rng.random(nrows) < nan_frac] = np.nan
+        cols[dtype + str(i)] = ser
+    return pd.DataFrame(cols)
+
+
+
+# < Running and comparing > ===============================================================
+
+def run_benchmarks(cases=None, entry_points=None, repeat=BENCH_REPEAT, verbose=True):
+    """
+    Times each entry point (default: all of ENTRY_POINTS) on make_frame() of each case (default:
+    bench_cases()). Returns list of dicts of the case, entry_point, secs (fastest of repeat runs,
+    as timed by a timing.Timer span) and peak_bytes (from tracemalloc, in a separate run, since
+    tracing slows things down).
+    """
+    if cases is None:
+        cases = bench_cases()
+    if entry_points is None:
+        entry_points = list(ENTRY_POINTS)
+    results = []
+    for case in cases:
+        df = make_frame(**case)
+        for entry_point in entry_points:
+            fn = ENTRY_POINTS[entry_point]
+            gc.collect()
+            tracemalloc.start()
+            fn(df)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            timer = timing.Timer()
+            for _ in range(repeat):
+                with timer.span(entry_point):
+                    fn(df)
+            result = OrderedDict(case)
+            result['entry_point'] = entry_point
+            result['secs'] = timer.span_stats()[entry_point]['min']
+            result['peak_bytes'] = peak_bytes
+            results.append(result)
+            if verbose:
+                print(_result_str(result))
+    return results
+
+def save_results(results, dir_path, git_hash=None):
+    """Writes results to dir_path/bench_<git hash>.json, returns that path"""
+    if git_hash is None:
+        git_hash = _git_hash()
+    os.makedirs(dir_path, exist_ok=True)
+    full_file_path = os.path.join(dir_path, 'bench_' + git_hash + '.json')
+    with open(full_file_path, 'w') as f:
+        json.dump({'git_hash': git_hash, 'created': timing.now_for_str(), 'results': results}, f, indent=1)
+    return full_file_path
+
+def load_results(full_file_path):
+    """Reads results written by save_results()"""
+    with open(full_file_path) as f:
+        return json.load(f)['results']
+
+def compare_results(results, baseline, time_threshold=REGRESSION_TIME_THRESHOLD,
+                    memory_threshold=REGRESSION_MEMORY_THRESHOLD, min_secs=REGRESSION_MIN_SECS):
+    """
+    Returns list of regressions: dicts of results that are more than time_threshold slower (and
+    by more than min_secs) or memory_threshold bigger in peak memory than the matching baseline
+    result (same case and entry point), with the baseline's secs and peak_bytes and their ratios.
+    """
+    baseline_by_key = {_result_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        base = baseline_by_key.get(_result_key(result))
+        if base is None:
+            continue
+        secs_ratio = result['secs'] / max(base['secs'], 1e-9)
+        memory_ratio = result['peak_bytes'] / max(base['peak_bytes'], 1)
+        slower = secs_ratio > 1 + time_threshold and result['secs'] - base['secs'] > min_secs
+        bigger = memory_ratio > 1 + memory_threshold
+        if slower or bigger:
+            regression = OrderedDict(result)
+            regression['base_secs'] = base['secs']
+            regression['base_peak_bytes'] = base['peak_bytes']
+            regression['secs_ratio'] = secs_ratio
+            regression['memory_ratio'] = memory_ratio
+            regressions.append(regression)
+    return regressions
+
+def _result_key(result):
+    return (result['entry_point'], result['nrows'], result['ncols'], tuple(result['dtype_mix']),
+            result['nan_frac'], result['cardinality'])
+
+def _result_str(result):
+    return '{:<20} nrows={:<10} ncols={:<4} {:<22} nan_frac={:<4} card={:<7} {:9.4f} secs {:>12} peak'.format(
+        result['entry_point'], result['nrows'], result['ncols'], '/'.join(result['dtype_mix']),
+        result['nan_frac'], result['cardinality'], result['secs'], iact._readable_memory(result['peak_bytes']))
+
+def _git_hash():
+    """misc.git_current_hash() of the defnotdatatools repo, or 'nogit' if it can't be read"""
+    try:
+        return misc.git_current_hash(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.git'))
+    except (OSError, IndexError):
+        return 'nogit'
+
+
+
+# < Import times > ===============================================================
+
+def import_times(modules=None, repeat=IMPORT_REPEAT):
+    """
+    Times importing each of modules (default: those in IMPORT_MAX_SECS; '' is the package itself)
+    in a fresh interpreter, so nothing's cached. Returns list of dicts of module, secs (fastest of
+    repeat runs, not counting interpreter startup) and heavy (which of IMPORT_HEAVY_MODULES got
+    imported along the way).
+    """
+    if modules is None:
+        modules = list(IMPORT_MAX_SECS)
+    pkg_name = __package__ or 'defnotdatatools'
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env.get('PYTHONPATH')]))
+    code = ('import json, sys, time; t = time.perf_counter(); import {name}; '
+            'print(json.dumps([time.perf_counter() - t, [m for m in {heavy!r} if m in sys.modules]]))')
+    results = []
+    for module in modules:
+        name = pkg_name + ('.' + module if module else '')
+        runs = [json.loads(subprocess.run([sys.executable, '-c', code.format(name=name, heavy=IMPORT_HEAVY_MODULES)],
+                                          env=env, check=True, capture_output=True, text=True).stdout)
+                for _ in range(repeat)]
+        results.append(OrderedDict([('module', name), ('secs', min(secs for secs, _ in runs)),
+                                    ('heavy', runs[0][1])]))
+    return results
+
+def slow_imports(results, max_secs=None):
+    """Returns those import_times() results slower than max_secs (default: IMPORT_MAX_SECS) or with heavy imports"""
+    if max_secs is None:
+        max_secs = IMPORT_MAX_SECS
+    pkg_name = __package__ or 'defnotdatatools'
+    return [result for result in results
+            if result['secs'] > max_secs[result['module'][len(pkg_name) + 1:]] or len(result['heavy']) > 0]
+
+
+
+# < Command line > ===============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark defnotdatatools entry points')
+    parser.add_argument('--rows', type=int, nargs='+', default=list(BENCH_ROWS))
+    parser.add_argument('--ncols', type=int, nargs='+', default=list(BENCH_NCOLS))
+    parser.add_argument('--entry-points', nargs='+', default=list(ENTRY_POINTS), choices=list(ENTRY_POINTS))
+    parser.add_argument('--repeat', type=int, default=BENCH_REPEAT)
+    parser.add_argument('--save-dir', help='dir to save results JSON in')
+    parser.add_argument('--baseline', help='results JSON to compare against')
+    parser.add_argument('--time-threshold', type=float, default=REGRESSION_TIME_THRESHOLD)
+    parser.add_argument('--memory-threshold', type=float, default=REGRESSION_MEMORY_THRESHOLD)
+    parser.add_argument('--imports', action='store_true',
+                        help='only check that importing the light modules stays fast (see IMPORT_MAX_SECS)')
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        results = import_times()
+        slow = slow_imports(results)
+        for result in results:
+            print('{}{:<28} {:9.4f} secs {}'.format('SLOW ' if result in slow else '', result['module'],
+                                                     result['secs'], ', '.join(result['heavy'])))
+        return 1 if len(slow) > 0 else 0
+
+    results = run_benchmarks(cases=bench_cases(rows=args.rows, ncols=args.ncols),
+                             entry_points=args.entry_points, repeat=args.repeat)
+    if args.save_dir is not None:
+        print('Saved to ' + save_results(results, args.save_dir))
+    if args.baseline is not None:
+        regressions = compare_results(results, load_results(args.baseline),
+                                      time_threshold=args.time_threshold, memory_threshold=args.memory_threshold)
+        for regression in regressions:
+            print('REGRESSION ' + _result_str(regression) + ' (was {:.4f} secs, {} peak)'.format(
+                regression['base_secs'], iact._readable_memory(regression['base_peak_bytes'])))
+        if len(regressions) > 0:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,11 +8,22 @@ For how to import, see defnotdatatools/README.md.
 
 # < Setup > ============================================================================
 
+import os
 import re
-import inspect
+import hashlib
+import html
+import pickle
+import reprlib
+import sys
+import time
+import types
+import warnings
 import numpy as np
 import pandas as pd
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from . import misc, sketch, timing
 
 try:
     __IPYTHON__
@@ -49,11 +60,12 @@ def dir_str(obj=None, pattern=DIR_DEFAULT_PATTERN, max_line_len=90):
     ret = []
     for attr_name in dir_list:
         attr = _getattr_or_attribute(obj=obj, attr_name=attr_name)
-        ret.append(attr_name.ljust(DIR_ATTR_NAME_WIDTH) + ": " + str(attr)[:max_line_len])
+        ret.append(attr_name.ljust(DIR_ATTR_NAME_WIDTH) + ": " + bounded_str(attr, max_len=max_line_len))
     return ret
 
 def dir_doc(obj=None, pattern=DIR_DEFAULT_PATTERN, max_line_len=90):
     """Shows docstrings (.__doc__) of items inside the module or class (max len 100)"""
+    import inspect
     dir_list = dir_regex(obj=obj, pattern=pattern)
     ret = []
     for attr_name in dir_list:
@@ -84,56 +96,103 @@ def _getattr_or_attribute(obj, attr_name):
 
 # < To get info about DataFrames and columns > ===========================================
 
+FLOAT_PCTILES = OrderedDict([('05_pctile', .05), ('25_pctile', .25), ('50_pctile', .50),
+                             ('75_pctile', .75), ('95_pctile', .95)])
+FLOAT_INFO_KEYS = ['filled_pct', 'miss_ct', 'min', 'max', 'min_medADs', 'max_medADs', 'medAD', 'MAD',
+                   'median', 'mean', 'std'] + list(FLOAT_PCTILES) + ['zeros_pct']
+FLOAT_BATCH_MAX_CELLS = 2 ** 22  # cols_info_float() does float cols in batches of at most this many cells
+DF_FULL_INFO_SECTIONS = ('df_summary', 'df_cols_float', 'df_cols_other')
+HTML_PAGE_ROWS = 500  # html_table() puts rows after this many in collapsed pages
+TIMER = timing.Timer('iact')  # times DFFullInfo's sections as spans; TIMER.record_events() to trace them
+
 def df_summary(df):
-    """Return df of info about passed DataFrame."""
+    """
+    Return df of info about passed DataFrame. Its memory_usage is deep (counts what object
+    values point to), estimated from a sample of rows, see df_memory_info() for a breakdown.
+    """
     assert isinstance(df, pd.DataFrame)
+    return _summary_df(nrows=len(df), ncols=len(df.columns), index_name=df.index.name,
+                       memory_bytes=df_memory_info(df, find_dups=False)['deep_bytes'].sum(), dtypes=df.dtypes)
+
+def _summary_df(nrows, ncols, index_name, memory_bytes, dtypes):
+    """Return df_summary() table, from its parts (dtypes is a Series of dtypes, one per col)"""
     info_pairs = OrderedDict()
-    info_pairs['nrows'] = str(len(df))
-    if len(df) > 99999:
-        info_pairs['nrows'] += ' (' + _readable_num(len(df)) + ')'
-    info_pairs['ncols'] = len(df.columns)
-    info_pairs['index'] = df.index.name
-    info_pairs['memory_usage'] = _readable_memory(df.memory_usage(index=True).sum())
-    counts = df.dtypes.value_counts()
-    info_pairs['dtypes'] = ', '.join([str(dtype) + '(' + str(count) + ')' for dtype, count in counts.iteritems()])
+    info_pairs['nrows'] = str(nrows)
+    if nrows > 99999:
+        info_pairs['nrows'] += ' (' + _readable_num(nrows) + ')'
+    info_pairs['ncols'] = ncols
+    info_pairs['index'] = index_name
+    info_pairs['memory_usage'] = _readable_memory(memory_bytes)
+    counts = dtypes.value_counts()
+    info_pairs['dtypes'] = ', '.join([str(dtype) + '(' + str(count) + ')' for dtype, count in counts.items()])
     return pd.DataFrame([info_pairs], columns=info_pairs.keys())
 
-def cols_info_float(df):
+def cols_info_float(df, n_jobs=1, executor='thread'):
     """
     Return df of info about float-like columns of passed DataFrame.
 
     pandas's most similar command is df.select_dtypes(exclude=['float']).describe().T
 
+    Gives the same table as running ser_info_any() and ser_info_float() on each column (up to
+    float rounding; float32 cols get float64 math), but computed by float_block_info() over the
+    whole float block at once, which is much faster for wide or long DataFrames. Batches of cols
+    are taken from df by position (views of its block when the float cols are next to each
+    other), so the float block is never copied as a whole.
+
+    Args:
+        n_jobs: number of batches of cols to do at once (-1 means one per CPU)
+        executor: 'thread' | 'process' | a concurrent.futures Executor, see float_block_info()
     """
     assert isinstance(df, pd.DataFrame)
-    odicts_lst = []
-    df_floats = df.select_dtypes(['float'])
-    for cn, ser in df_floats.iteritems():
-        odict = ser_info_any(ser)
-        odict.update(ser_info_float(ser))
-        odicts_lst.append(odict)
-    if len(odicts_lst) == 0:
+    poss = [i for i, dtype in enumerate(df.dtypes) if isinstance(dtype, np.dtype) and dtype.kind == 'f']
+    if len(poss) == 0:
         return None
-    ret_df = pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys())
-    assert len(df_floats.dtypes) == len(ret_df)
-    ret_df = ret_df.set_index('name')
-    ret_df['dtype'] = df_floats.dtypes.apply(str)
-    ret_df = ret_df.applymap(lambda x: x.decode() if isinstance(x, bytes) else x)
+
+    def get_cols(start, stop):
+        batch_poss = poss[start:stop]
+        if (batch_poss[-1] - batch_poss[0] == len(batch_poss) - 1  # a slice, so no copy within a block
+                and df.dtypes.iloc[batch_poss].nunique() == 1):
+            return df.iloc[:, batch_poss[0]:batch_poss[-1] + 1].values
+        values = np.empty((len(df), len(batch_poss)), order='F')
+        for j, pos in enumerate(batch_poss):
+            values[:, j] = df.iloc[:, pos].values
+        return values
+
+    info = _float_cols_info(get_cols, (len(df), len(poss)), n_jobs=n_jobs, executor=executor)
+    return _float_info_df(info, names=df.columns[poss], dtypes=df.dtypes.iloc[poss])
+
+def _float_info_df(info, names, dtypes):
+    """Return cols_info_float() table, from float_block_info()-style info"""
+    # As when this table was built from ser_info_float()'s OrderedDicts, the first column decides
+    # which cols the table has: no min_medADs/max_medADs if its medAD is 0, no zeros_pct if it's all NaN
+    cns = list(FLOAT_INFO_KEYS)
+    if np.isnan(info['min'][0]):
+        cns.remove('zeros_pct')
+    elif info['medAD'][0] == 0:
+        cns.remove('min_medADs')
+        cns.remove('max_medADs')
+    ret_df = pd.DataFrame(info, columns=cns, index=pd.Index(list(names), name='name', tupleize_cols=False))
+    ret_df['dtype'] = [str(dtype) for dtype in dtypes]
     return ret_df
 
-def cols_info_other(df):
+def cols_info_other(df, n_jobs=1):
     """
     Return df of info about other (non-float like) columns of passed DataFrame.
 
     pandas's most similar command is df.select_dtypes(exclude=['float']).describe().T
+
+    Args:
+        n_jobs: number of cols to do at once, in a thread pool (-1 means one per CPU). These cols
+            can hold Python objects, which can't go in shared memory, so there's no process option.
     """
     assert isinstance(df, pd.DataFrame)
-    odicts_lst = []
     df_others = df.select_dtypes(exclude=['float'])
-    for cn, ser in df_others.iteritems():
-        odict = ser_info_any(ser)
-        odict.update(ser_info_other(ser))
-        odicts_lst.append(odict)
+    sers = [ser for cn, ser in df_others.items()]
+    if _n_workers(n_jobs) > 1 and len(sers) > 1:
+        with ThreadPoolExecutor(max_workers=_n_workers(n_jobs)) as pool:
+            odicts_lst = list(pool.map(ser_info_factorized, sers))  # map() keeps col order
+    else:
+        odicts_lst = [ser_info_factorized(ser) for ser in sers]
     if len(odicts_lst) == 0:
         return None
     ret_df = pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys())
@@ -142,6 +201,53 @@ def cols_info_other(df):
     ret_df = ret_df.applymap(lambda x: x.decode() if isinstance(x, bytes) else x)
     return ret_df
 
+def ser_info_factorized(ser, n_mostfreq=3):
+    """
+    Return the same OrderedDict as ser_info_any() plus ser_info_other() for a non-float Series, but
+    from one pass over it: pd.factorize() (or a category col's own codes), then counts per
+    distinct value by np.bincount(), and everything else from those: nunique, the n_mostfreq most
+    frequent (picked out without sorting all the counts; ties go to the value seen first, or for
+    categories, the first category), and min and max of just the distinct values. Unordered
+    category cols get the min and max of their values, ordered ones by category order.
+    """
+    assert isinstance(ser, pd.Series)
+    if isinstance(ser.dtype, pd.CategoricalDtype):
+        codes, uniques = ser.cat.codes.values, ser.cat.categories
+    else:
+        codes, uniques = pd.factorize(ser, sort=False)
+    counts = np.bincount(codes + 1, minlength=len(uniques) + 1)  # + 1 so NaN's -1 goes in counts[0]
+    miss_ct, counts = int(counts[0]), counts[1:]
+    ser_count = len(ser) - miss_ct
+
+    info_pairs = OrderedDict()
+    info_pairs['name'] = ser.name
+    info_pairs['filled_pct'] = ser_count / len(ser) if len(ser) > 0 else np.nan
+    info_pairs['miss_ct'] = miss_ct
+    used = np.flatnonzero(counts)
+    if len(used) == 0:
+        info_pairs['min'] = info_pairs['max'] = np.nan
+    elif isinstance(ser.dtype, pd.CategoricalDtype) and ser.cat.ordered:
+        info_pairs['min'], info_pairs['max'] = uniques[used[0]], uniques[used[-1]]
+    else:
+        used_uniques = pd.Series(uniques[used] if len(used) < len(uniques) else uniques)
+        info_pairs['min'], info_pairs['max'] = used_uniques.min(), used_uniques.max()
+    info_pairs['nunique'] = len(used)
+
+    if len(used) > n_mostfreq:  # candidates: values with at least the n_mostfreq-th biggest count
+        threshold = np.partition(counts, len(counts) - n_mostfreq)[len(counts) - n_mostfreq]
+        candidates = np.flatnonzero(counts >= threshold)
+    else:
+        candidates = used
+    top = candidates[np.lexsort((candidates, -counts[candidates]))][:n_mostfreq]
+    for i in range(n_mostfreq):
+        if i < len(top):
+            info_pairs['mostfreq' + str(i+1)] = uniques[top[i]]
+            info_pairs['mf' + str(i+1) + '_pct'] = counts[top[i]] / ser_count
+        else:  # if there are fewer than n_mostfreq values in series, use nan
+            info_pairs['mostfreq' + str(i+1)] = np.nan
+            info_pairs['mf' + str(i+1) + '_pct'] = np.nan
+    return info_pairs
+
 def ser_info_any(ser):
     """Return OrderedDict of info about any Series."""
     assert isinstance(ser, pd.Series)
@@ -186,6 +292,190 @@ def ser_info_float(ser):
     info_pairs['zeros_pct'] = len(ser[ser == 0]) / len(ser)
     return info_pairs
 
+def float_block_info(values, n_jobs=1, executor='thread'):
+    """
+    Return OrderedDict of info about each column of a 2D float array (ignoring NaNs), with
+    FLOAT_INFO_KEYS as keys and 1D arrays (one item per column) as values.
+
+    These are the same stats as ser_info_any() plus ser_info_float(), but each family of stats
+    is done in one vectorized pass over a batch of columns: one sort gives min, max, median and
+    all pctiles, a second sort gives medAD, and mean/std/MAD are column sums. Batches are at most
+    FLOAT_BATCH_MAX_CELLS, and each batch needs just one float buffer and one bool mask, so
+    there are no per-column copies.
+
+    Args:
+        n_jobs: number of batches to do at once (-1 means one per CPU). Results are the same,
+            in the same col order, whatever n_jobs is. The batches at once share
+            FLOAT_BATCH_MAX_CELLS, so buffers take about as much memory whatever n_jobs is
+            (unless a single col has more rows than that)
+        executor: 'thread' (default; numpy's sorts and sums release the GIL, and threads see
+            values without copying it) | 'process' (values is copied once into shared memory,
+            which the worker processes read from, rather than pickling batches to them) | a
+            concurrent.futures Executor to use (shared memory if it's a ProcessPoolExecutor)
+    """
+    values = np.asarray(values)
+    assert values.ndim == 2
+    return _float_cols_info(lambda start, stop: values[:, start:stop], values.shape,
+                            n_jobs=n_jobs, executor=executor)
+
+def _float_cols_info(get_cols, shape, n_jobs=1, executor='thread'):
+    """
+    Does float_block_info() for a block of the passed shape, where get_cols(start, stop) gives
+    the 2D values of cols start:stop, so callers needn't make the whole block as one array
+    """
+    n_rows, n_cols = shape
+    n_workers = _n_workers(n_jobs)
+    batch_ncols = max(1, min(FLOAT_BATCH_MAX_CELLS // max(n_rows * n_workers, 1), -(-n_cols // n_workers)))
+    col_ranges = [(i, min(i + batch_ncols, n_cols)) for i in range(0, n_cols, batch_ncols)]
+    if n_workers > 1 and len(col_ranges) > 1:
+        batch_infos = _float_batch_infos_in_pool(get_cols, shape, col_ranges, n_workers, executor)
+    else:
+        batch_infos = [_float_batch_info(get_cols(start, stop)) for start, stop in col_ranges]
+    if len(batch_infos) == 0:
+        batch_infos = [_float_batch_info(np.empty((n_rows, 0)))]
+    return OrderedDict((key, np.concatenate([batch_info[key] for batch_info in batch_infos]))
+                       for key in FLOAT_INFO_KEYS)
+
+def _float_batch_infos_in_pool(get_cols, shape, col_ranges, n_workers, executor):
+    """Does _float_batch_info() for each (start, stop) range of cols, in a thread or process pool"""
+    from concurrent.futures import ProcessPoolExecutor  # imports multiprocessing, so only when needed
+    if isinstance(executor, str):
+        if executor not in ('thread', 'process'):
+            raise ValueError("executor must be 'thread', 'process', or an Executor, not " + executor)
+        pool_cls = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+        with pool_cls(max_workers=n_workers) as pool:
+            return _float_batch_infos_in_pool(get_cols, shape, col_ranges, n_workers, pool)
+    if not isinstance(executor, ProcessPoolExecutor):
+        return list(executor.map(lambda cols: _float_batch_info(get_cols(*cols)), col_ranges))
+
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(create=True, size=max(shape[0] * shape[1] * 8, 1))
+    try:
+        shm_values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order='F')
+        for start, stop in col_ranges:
+            shm_values[:, start:stop] = get_cols(start, stop)
+        del shm_values  # must let go of the buffer before close()
+        n_batches = len(col_ranges)
+        return list(executor.map(_float_shm_batch_info, [shm.name] * n_batches,
+                                 [shape] * n_batches, col_ranges))
+    finally:
+        shm.close()
+        shm.unlink()
+
+def _float_shm_batch_info(shm_name, shape, cols):
+    """Process pool worker: does _float_batch_info() for cols of a float block in shared memory"""
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=shm_name)
+    values = None  # so the finally can't hide an error from np.ndarray() with an UnboundLocalError
+    try:
+        values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order='F')
+        return _float_batch_info(values[:, cols[0]:cols[1]])
+    finally:
+        del values  # must let go of the buffer before close()
+        shm.close()
+
+def _n_workers(n_jobs):
+    """Number of workers for n_jobs, where None means 1 and -1 means one per CPU"""
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+def _float_batch_info(values):
+    """Does float_block_info() for one batch of columns (a 2D float array)"""
+    values = np.asfortranarray(values, dtype=np.float64)  # no copy if it's a float64 df's block
+    n_rows, n_cols = values.shape
+    isnan = np.isnan(values)
+    count = n_rows - isnan.sum(axis=0)
+    info = OrderedDict((key, np.full(n_cols, np.nan)) for key in FLOAT_INFO_KEYS)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        info['filled_pct'] = count / n_rows
+    info['miss_ct'] = n_rows - count
+    if n_rows == 0:
+        return info
+
+    has_vals = count > 0
+    cols = np.arange(n_cols)
+    last = np.maximum(count - 1, 0)
+
+    # Sort each column once (NaNs go last), so min, max, median and pctiles are just lookups
+    buf = np.array(values, order='F')
+    buf.sort(axis=0)
+    info['min'] = buf[0, cols]
+    info['max'] = buf[last, cols]
+    median = _sorted_median(buf, count)
+    for key, q in FLOAT_PCTILES.items():
+        info[key] = _sorted_pctile(buf, count, q)
+
+    # Sorting abs deviations from the median (NaNs still go last) gives medAD
+    with np.errstate(invalid='ignore'):
+        np.subtract(buf, median, out=buf)
+    np.abs(buf, out=buf)
+    buf.sort(axis=0)
+    med_AD = _sorted_median(buf, count)
+
+    # Column sums (NaNs zeroed) give mean, then MAD and std from deviations from the mean
+    np.copyto(buf, values)
+    buf[isnan] = 0
+    with np.errstate(divide='ignore', invalid='ignore'):  # inf - inf is NaN, as in pandas
+        mean = buf.sum(axis=0) / np.maximum(count, 1)
+        np.subtract(values, mean, out=buf)
+        buf[isnan] = 0
+        np.abs(buf, out=buf)
+        # Like pandas's mad(), skip deviations that are NaN because they're inf - inf
+        dev_isnan = np.isnan(buf)
+        dev_nans = dev_isnan.sum(axis=0)
+        if dev_nans.any():
+            mean_AD = np.where(dev_isnan, 0, buf).sum(axis=0) / (count - dev_nans)
+        else:
+            mean_AD = buf.sum(axis=0) / np.maximum(count, 1)
+        del dev_isnan
+        np.square(buf, out=buf)
+        std = np.sqrt(buf.sum(axis=0) / (count - 1))
+        min_medADs = (median - info['min']) / med_AD
+        max_medADs = (info['max'] - median) / med_AD
+        zeros_pct = (values == 0).sum(axis=0) / count
+    std[count < 2] = np.nan
+
+    info['min_medADs'] = np.where(med_AD != 0, min_medADs, np.nan)
+    info['max_medADs'] = np.where(med_AD != 0, max_medADs, np.nan)
+    info['medAD'] = med_AD
+    info['MAD'] = mean_AD
+    info['median'] = median
+    info['mean'] = mean
+    info['std'] = std
+    info['zeros_pct'] = zeros_pct
+    for key in FLOAT_INFO_KEYS[2:]:  # everything but filled_pct and miss_ct is NaN for all-NaN cols
+        info[key] = np.where(has_vals, info[key], np.nan)
+    return info
+
+def _sorted_median(buf, count):
+    """Median of each column of buf, which is sorted with count non-NaNs at the top"""
+    cols = np.arange(buf.shape[1])
+    lower = buf[np.maximum(count - 1, 0) // 2, cols]
+    upper = buf[count // 2, cols]
+    with np.errstate(invalid='ignore'):  # -inf and inf average to NaN, as in Series.median()
+        return (lower + upper) / 2
+
+def _sorted_pctile(buf, count, q):
+    """
+    The q quantile of each column of buf, which is sorted with count non-NaNs at the top.
+    Interpolates linearly exactly like np.percentile (used by pd.Series.quantile) does.
+    """
+    cols = np.arange(buf.shape[1])
+    q = q * 100.0 / 100  # Series.quantile passes q to np.percentile as a percent
+    virtual_idx = (np.maximum(count, 1) - 1) * q
+    lower_idx = np.floor(virtual_idx)
+    gamma = virtual_idx - lower_idx
+    lower_idx = lower_idx.astype(np.intp)
+    upper_idx = np.minimum(lower_idx + 1, np.maximum(count - 1, 0))
+    lower = buf[lower_idx, cols]
+    upper = buf[upper_idx, cols]
+    with np.errstate(invalid='ignore'):  # inf - inf is NaN, as in np.percentile
+        diff = upper - lower
+        return np.where(gamma >= 0.5, upper - diff * (1 - gamma), lower + diff * gamma)
+
 def ser_info_other(ser):
     """Return OrderedDict of info about any non-float Series (ignoring NaNs)."""
     assert isinstance(ser, pd.Series)
@@ -204,15 +494,41 @@ def ser_info_other(ser):
             info_pairs['mf' + str(i+1) + '_pct'] = value_counts.iloc[i] / ser_count
     return info_pairs
 
-def df_full_info(df, name=''):
+def df_full_info(df, name='', n_jobs=1, executor='thread', sample_rows=None, sample_secs=None,
+                 stratify_by=None, exact_minmax=True, seed=None, cache=None, sections=DF_FULL_INFO_SECTIONS):
     """
     Displays info about passed df, including df_summary(), cols_info_ fns, and more.
 
+    Args:
+        n_jobs, executor: to profile cols in parallel, see cols_info_float() and cols_info_other()
+        sample_rows: if df has more rows than this, profile a sample of this many rows instead.
+            The DFFullInfo then has a df_approx table of confidence intervals for filled_pct,
+            mean, and pctiles, and an estimate of nunique for the full df.
+        sample_secs: sample as many rows as fit in about this many secs (also capped by sample_rows)
+        stratify_by: col name to stratify the sample by, proportionally, so df_approx's intervals
+            (uniform sample formulas) are conservative (default is a uniform sample)
+        exact_minmax: when sampling, whether to get exact filled_pct, miss_ct, min and max of numeric,
+            bool and datetime cols with a (cheap, vectorized) pass over all rows
+        seed: random seed for the sample
+        cache: a DFFullInfoCache to get the result from (or put it in), or True for one in
+            DF_FULL_INFO_CACHE_DIR. Repeat calls on an unchanged df then cost just a hash.
+        sections: which of DF_FULL_INFO_SECTIONS to have (others are None). Each is only computed
+            when first accessed, eg sections=['df_summary'] costs just df_summary(). Not for sampling.
+
     Returns: a DFFullInfo object which makes all that info available, as well as the HTML
     displayed, in case you'd want to use this info in reports or combine with other tables' info.
     """
     assert isinstance(df, pd.DataFrame)
-    return DFFullInfo(df=df, name=name)
+    if cache is not None and cache is not False:
+        cache = _get_default_cache() if cache is True else cache
+        return cache.df_full_info(df=df, name=name, n_jobs=n_jobs, executor=executor,
+                                  sample_rows=sample_rows, sample_secs=sample_secs, stratify_by=stratify_by,
+                                  exact_minmax=exact_minmax, seed=seed, sections=sections)
+    if sample_rows is not None or sample_secs is not None:
+        return _sampled_df_full_info(df=df, name=name, sample_rows=sample_rows, sample_secs=sample_secs,
+                                     stratify_by=stratify_by, exact_minmax=exact_minmax, seed=seed,
+                                     n_jobs=n_jobs, executor=executor)
+    return DFFullInfo(df=df, name=name, n_jobs=n_jobs, executor=executor, sections=sections)
 
 def styler_cell(val, precision=3):
     """
@@ -245,6 +561,85 @@ def styler_df(df):
     """
     return df.style.format(styler_cell)
 
+def format_df(df, precision=3):
+    """
+    Return df of str, each cell formatted the same as styler_cell() formats it for styler_df(),
+    but with numeric (int, float, bool) cols done a whole col at a time with numpy, which is much
+    faster for wide reports. Other cols (eg object, datetime) go cell by cell through styler_cell().
+    """
+    assert isinstance(df, pd.DataFrame)
+    formatted_cols = []
+    for i in range(len(df.columns)):
+        ser = df.iloc[:, i]
+        if pd.api.types.is_numeric_dtype(ser.dtype) and isinstance(ser.values, np.ndarray):
+            formatted_cols.append(_format_floats(ser.values.astype(np.float64), precision=precision))
+        else:
+            formatted_cols.append(np.array([str(styler_cell(val, precision=precision))
+                                            for val in ser.tolist()], dtype=object))
+    ret = pd.DataFrame(dict(enumerate(formatted_cols)), index=df.index, columns=range(len(df.columns)))
+    ret.columns = df.columns
+    return ret
+
+def _format_floats(values, precision=3):
+    """Returns object array of str, formatting a float array like styler_cell() does each float"""
+    ret = np.empty(len(values), dtype=object)
+    with np.errstate(invalid='ignore'):
+        is_big = np.abs(values) >= 10000  # _readable_num()'s k/M/B, dividing by 1000 like it does
+    if is_big.any():
+        big = values[is_big]
+        thousands = big / 1000.0
+        millions = thousands / 1000.0
+        billions = millions / 1000.0
+        scaled = np.where(np.abs(thousands) < 1000.0, thousands,
+                          np.where(np.abs(millions) < 1000.0, millions, billions))
+        units = np.where(np.abs(thousands) < 1000.0, 'k', np.where(np.abs(millions) < 1000.0, 'M', 'B'))
+        ret[is_big] = np.char.add(np.char.mod('%3.1f', scaled), units).astype(object)
+    if not is_big.all():
+        # round to precision+1 significant digits, the same way styler_cell() does: via str
+        rounded = np.char.mod('%.{}e'.format(precision), values[~is_big]).astype(np.float64)
+        small = np.char.mod('%r', rounded).astype(object)  # str(float)
+        with np.errstate(invalid='ignore'):
+            is_fraction = (-1 < rounded) & (rounded < 1)
+            small[is_fraction] = np.char.mod('%.4f', rounded[is_fraction]).astype(object)
+            small[rounded == 0] = '0'
+            small[rounded == 1] = '1'
+            small[rounded == -1] = '-1'
+        ret[~is_big] = small
+    return ret
+
+def html_table(df, page_rows=HTML_PAGE_ROWS, max_rows=None):
+    """
+    Return light html table of df, formatted by format_df(): no per-cell styles or ids like
+    styler_df().render() makes, so it's much quicker to make and display, and smaller on disk.
+
+    Args:
+        page_rows: rows after the first page_rows are split into pages of this many rows, each
+            in a collapsed <details> that the browser only lays out when opened (None for no pages)
+        max_rows: only include this many rows (None for all), noting how many were left out
+    """
+    n_rows_total = len(df)
+    if max_rows is not None:
+        df = df.iloc[:max_rows]
+    df_str = format_df(df)
+    header = '<thead><tr><th>' + html.escape(str(df.index.name or '')) + '</th>' + \
+             ''.join('<th>' + html.escape(str(cn)) + '</th>' for cn in df.columns) + '</tr></thead>'
+    index_strs = [html.escape(str(idx)) for idx in df.index]
+    rows = ['<tr><th>' + idx + '</th><td>' + '</td><td>'.join(html.escape(val) for val in vals) + '</td></tr>'
+            for idx, vals in zip(index_strs, df_str.itertuples(index=False, name=None))]
+    if page_rows is None:
+        page_rows = max(len(rows), 1)
+    hlst = []
+    for start in range(0, max(len(rows), 1), page_rows):
+        table = '<table>' + header + '<tbody>' + ''.join(rows[start:start + page_rows]) + '</tbody></table>'
+        if start == 0:
+            hlst.append(table)
+        else:
+            hlst.append('<details><summary>rows {}-{} of {}</summary>{}</details>'.format(
+                start + 1, min(start + page_rows, len(rows)), len(rows), table))
+    if len(df) < n_rows_total:
+        hlst.append('<p>({} more rows not shown)</p>'.format(n_rows_total - len(df)))
+    return '\n'.join(hlst)
+
 def _readable_num(nrows):
     """Adapted from http://stackoverflow.com/a/1094933"""
     if abs(nrows) < 10000.0:
@@ -269,17 +664,105 @@ class DFFullInfo():
     """
     Class that creates, displays, and stores info about passed DataFrame. This doesn't
     store the original df, just the summary info about it, so this takes up virtually no memory.
+
+    Each section (df_summary, df_cols_float, df_cols_other), as well as df_cols_all and html, is
+    computed on first access and then kept. Until all the sections are computed, the df is kept
+    too. Sections not in the sections arg aren't ever computed, and are None.
     """
 
-    def __init__(self, df, name):
+    def __init__(self, df, name, n_jobs=1, executor='thread', sections=DF_FULL_INFO_SECTIONS):
+        for section in sections:
+            if section not in DF_FULL_INFO_SECTIONS:
+                raise ValueError('Unknown section {}, must be one of {}'.format(section, DF_FULL_INFO_SECTIONS))
+        self.name = name
+        self._tables = OrderedDict((section, None) for section in DF_FULL_INFO_SECTIONS
+                                   if section not in sections)
+        self._tables['df_approx'] = None
+        self._df = df
+        self._n_jobs = n_jobs
+        self._executor = executor
+
+    @classmethod
+    def construct_from_tables(cls, df_summary, df_cols_float, df_cols_other, name='', df_approx=None):
+        """
+        Alternate constructor from already-made tables, eg by DFInfoAccumulator for a df that
+        never fit in memory. df_approx, if passed, says which fields are approximate and how much.
+        """
+        new_info = cls.__new__(cls)
+        new_info._set_tables(name=name, df_summary=df_summary, df_cols_float=df_cols_float,
+                             df_cols_other=df_cols_other, df_approx=df_approx)
+        return new_info
+
+    def _set_tables(self, name, df_summary, df_cols_float, df_cols_other, df_approx=None):
         self.name = name
-        self.df_summary = df_summary(df)
-        self.df_cols_float = cols_info_float(df)
-        self.df_cols_other = cols_info_other(df)
-        self.df_cols_all = self._make_df_cols_all()
-        self.html = self._make_html()
+        self._tables = OrderedDict([('df_summary', df_summary), ('df_cols_float', df_cols_float),
+                                    ('df_cols_other', df_cols_other), ('df_approx', df_approx)])
+        self._df = None
+
+    @property
+    def df_summary(self):
+        return self._get_table('df_summary')
+
+    @property
+    def df_cols_float(self):
+        return self._get_table('df_cols_float')
+
+    @property
+    def df_cols_other(self):
+        return self._get_table('df_cols_other')
+
+    @property
+    def df_approx(self):
+        """Table of which fields are approximate and how much, if any are (eg when sampling)"""
+        return self._get_table('df_approx')
+
+    @property
+    def df_cols_all(self):
+        """df_cols_float and df_cols_other in one table"""
+        return self._get_table('df_cols_all')
+
+    @property
+    def html(self):
+        return self._get_table('html')
+
+    def _get_table(self, key):
+        """Returns table (or html) for key, computing it if it's the first time it's asked for"""
+        if key not in self._tables:
+            with TIMER.span('DFFullInfo.' + key, info_name=self.name):
+                self._compute_table(key)
+            if all(section in self._tables for section in DF_FULL_INFO_SECTIONS):
+                self._df = None  # all done with df, so let go of it
+        return self._tables[key]
+
+    def _compute_table(self, key):
+        if key == 'df_summary':
+            self._tables[key] = df_summary(self._df)
+        elif key == 'df_cols_float':
+            self._tables[key] = cols_info_float(self._df, n_jobs=self._n_jobs, executor=self._executor)
+        elif key == 'df_cols_other':
+            self._tables[key] = cols_info_other(self._df, n_jobs=self._n_jobs)
+        elif key == 'df_cols_all':
+            self._tables[key] = self._make_df_cols_all()
+        elif key == 'html':
+            self._tables[key] = self._make_html()
+
+    def compute_all(self):
+        """Computes any sections not done yet (so the df can be let go of), returns self"""
+        for section in DF_FULL_INFO_SECTIONS:
+            self._get_table(section)
+        return self
+
+    def __getstate__(self):
+        """For pickling: computes any sections not done yet, so the df isn't pickled along"""
+        self.compute_all()
+        return self.__dict__.copy()
 
     def _make_df_cols_all(self):
+        if self.df_cols_float is None or self.df_cols_other is None:
+            df = self.df_cols_float if self.df_cols_other is None else self.df_cols_other
+            if df is None:
+                return None
+            return pd.concat([df[['dtype']], df.drop('dtype', axis=1)], axis=1)
         df = pd.merge(self.df_cols_float, self.df_cols_other,
                       how='outer', left_index=True, right_index=True)
 
@@ -297,7 +780,7 @@ class DFFullInfo():
             df[stem] = ser
             del df[cn_f]
             del df[cn_o]
-        stems = ['dtype'] + stems  # putting dtype first in the order
+        stems = ['dtype'] + [stem for stem in stems if stem != 'dtype']  # putting dtype first in the order
         return pd.concat([df[stems], df.drop(stems, axis=1)], axis=1)
 
     def _make_html(self):
@@ -309,11 +792,17 @@ class DFFullInfo():
         if self.name != '':
             hlst.append('<h3>df_full_info(): ' + self.name + '</h3>')
 
-        hlst.append(self.df_summary.to_html(index=False))
-        hlst.append('<h5>cols_info_float():</h5>')
-        hlst.append(styler_df(self.df_cols_float).render())
-        hlst.append('<h5>cols_info_other():</h5>')
-        hlst.append(styler_df(self.df_cols_other).render())
+        if self.df_summary is not None:
+            hlst.append(self.df_summary.to_html(index=False))
+        if self.df_cols_float is not None:
+            hlst.append('<h5>cols_info_float():</h5>')
+            hlst.append(html_table(self.df_cols_float))
+        if self.df_cols_other is not None:
+            hlst.append('<h5>cols_info_other():</h5>')
+            hlst.append(html_table(self.df_cols_other))
+        if self.df_approx is not None:
+            hlst.append('<h5>approximate fields (error bounds):</h5>')
+            hlst.append(html_table(self.df_approx))
         return '\n'.join(hlst)
 
     def _repr_html_(self):
@@ -330,19 +819,1651 @@ class DFFullInfo():
     def to_html(self, full_file_path):
         """Writes HTML output to file"""
         with open(full_file_path, "w") as f:
-            f.write(df_summary._make_html())
+            f.write(self.html)
 
     def to_excel(self, full_file_path):
         with pd.ExcelWriter(full_file_path) as writer:
-            self.df_summary.to_excel(writer, sheet_name = 'df_summary')
-            self.df_cols_all.to_excel(writer, sheet_name = 'df_cols_all')
-            self.df_cols_float.to_excel(writer, sheet_name = 'df_cols_float')
-            self.df_cols_other.to_excel(writer, sheet_name = 'df_cols_other')
+            for sheet_name in ('df_summary', 'df_cols_all', 'df_cols_float', 'df_cols_other', 'df_approx'):
+                if getattr(self, sheet_name) is not None:
+                    getattr(self, sheet_name).to_excel(writer, sheet_name = sheet_name)
+
+    @classmethod
+    def construct_from_parquet(cls, full_file_path):
+        """Alternate constructor from a file written by to_parquet()"""
+        import pyarrow.parquet  # optional dependency, only needed for Parquet
+        table = pyarrow.parquet.read_table(full_file_path, memory_map=True)
+        meta = _profile_meta(table.schema, full_file_path)
+        df_rows = table.to_pandas()
+        tables = OrderedDict()
+        for key in ('df_cols_float', 'df_cols_other', 'df_approx'):
+            tables[key] = _profile_table_from_rows(df_rows, meta['tables'][key])
+        summary_meta = meta['tables']['df_summary']
+        tables['df_summary'] = None if summary_meta is None else pd.DataFrame(
+            summary_meta['values'], columns=summary_meta['columns']).astype(dict(zip(summary_meta['columns'],
+                                                                                     summary_meta['dtypes'])))
+        return cls.construct_from_tables(name=meta['name'], **tables)
+
+    def to_parquet(self, full_file_path):
+        """
+        Writes the info to a Parquet file, one row per profiled col (its cols_info_float() or
+        cols_info_other() fields plus any df_approx ones), with df_summary and everything needed
+        to rebuild the tables exactly in the file's metadata. Read it back with
+        construct_from_parquet(), or many at once with stack_df_full_info_files().
+
+        Parquet cols have one type, so cols_info_other()'s min, max (as min_str and max_str), and
+        mostfreq values are stored as str. They're converted back for numeric, bool, and datetime
+        cols, but come back as str for object and category cols whose values aren't str.
+        """
+        import json
+        import pyarrow  # optional dependency, only needed for Parquet
+        import pyarrow.parquet
+        df_rows, meta = _profile_rows(self)
+        table = pyarrow.Table.from_pandas(df_rows, preserve_index=False)
+        schema_meta = dict(table.schema.metadata or {})
+        schema_meta[PROFILE_META_KEY] = json.dumps(meta, default=str).encode()
+        pyarrow.parquet.write_table(table.replace_schema_metadata(schema_meta), full_file_path)
+
+
+
+# < Saving and loading df_full_info results > ===========================================
+
+PROFILE_META_KEY = b'defnotdatatools.DFFullInfo'
+PROFILE_FORMAT_VERSION = 1
+PROFILE_ROW_SECTIONS = OrderedDict([('df_cols_float', 'float'), ('df_cols_other', 'other')])
+PROFILE_OTHER_RENAMES = {'min': 'min_str', 'max': 'max_str'}  # stored as str, unlike df_cols_float's
+
+def stack_df_full_info_files(full_file_paths, columns=None, n_jobs=1):
+    """
+    Returns one DataFrame of the per-col rows of many DFFullInfo.to_parquet() files, eg daily
+    profiles of the same table, to compare them. Each file is memory-mapped and only the asked
+    for cols are read, then the Arrow tables are concatenated without copying, so the only
+    copy made is the final conversion to pandas.
+
+    Args:
+        full_file_paths: list of files written by DFFullInfo.to_parquet()
+        columns: list of cols to read, eg ['mean', 'filled_pct'] (default: all). The file,
+            info_name, section ('float' or 'other'), and name (of the profiled col) cols are
+            always included.
+        n_jobs: number of files to read at once, in threads
+
+    Returns:
+        DataFrame with file and info_name cols (as categories), then the rest. Float cols'
+        min and max are in min and max, other cols' in min_str and max_str; those and mostfreq
+        values stay str here (unlike construct_from_parquet()), since they'd have a different
+        type per row. Cols missing from some files are NaN there.
+    """
+    import pyarrow  # optional dependency, only needed for Parquet
+    read_cns = None if columns is None else ['section', 'name'] + [cn for cn in columns
+                                                                   if cn not in ('section', 'name')]
+    def read_file(full_file_path):
+        import pyarrow.parquet
+        parquet_file = pyarrow.parquet.ParquetFile(full_file_path, memory_map=True)
+        schema = parquet_file.schema_arrow
+        file_cns = None if read_cns is None else [cn for cn in read_cns if cn in schema.names]
+        table = parquet_file.read(columns=file_cns, use_pandas_metadata=False)
+        info_name = _profile_meta(schema, full_file_path)['name']
+        name_idx = table.schema.get_field_index('name')
+        if not pyarrow.types.is_string(table.schema.field(name_idx).type):  # eg ints, for a df with no col names
+            table = table.set_column(name_idx, 'name', table.column(name_idx).cast(pyarrow.string()))
+        zeros = pyarrow.array(np.zeros(table.num_rows, dtype=np.int32))
+        table = table.add_column(0, 'info_name', pyarrow.DictionaryArray.from_arrays(
+            zeros, pyarrow.array([str(info_name)])))
+        return table.add_column(0, 'file', pyarrow.DictionaryArray.from_arrays(
+            zeros, pyarrow.array([str(full_file_path)])))
+    full_file_paths = list(full_file_paths)
+    if n_jobs == 1:
+        tables = [read_file(full_file_path) for full_file_path in full_file_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:  # pyarrow reads without the GIL
+            tables = list(pool.map(read_file, full_file_paths))
+    if len(tables) == 0:
+        return pd.DataFrame(columns=['file', 'info_name', 'section', 'name'] + list(columns or []))
+    if int(pyarrow.__version__.split('.')[0]) >= 14:
+        table = pyarrow.concat_tables(tables, promote_options='permissive')  # eg int and float cols -> float
+    else:
+        table = pyarrow.concat_tables(tables, promote=True)
+    df = table.to_pandas()
+    if columns is not None:
+        df = df.reindex(columns=['file', 'info_name', 'section', 'name'] + list(columns))
+    return df
+
+def _profile_rows(info):
+    """
+    Returns (df_rows, meta) for DFFullInfo.to_parquet(): df_rows has a row per col of the
+    profiled df, with section and name cols first, and meta has what's needed to split it
+    back into the tables.
+    """
+    meta = OrderedDict([('format_version', PROFILE_FORMAT_VERSION), ('name', info.name),
+                        ('created', timing.now_for_str()), ('tables', OrderedDict())])
+    parts = []
+    n_rows = 0
+    for key, section in PROFILE_ROW_SECTIONS.items():
+        table = getattr(info, key)
+        if table is None:
+            meta['tables'][key] = None
+            continue
+        renames = PROFILE_OTHER_RENAMES if key == 'df_cols_other' else {}
+        meta['tables'][key] = _profile_table_meta(table, range(n_rows, n_rows + len(table)), renames)
+        parts.append(_profile_table_stored(table, renames).assign(section=section))
+        n_rows += len(table)
+    df_rows = pd.concat(parts) if len(parts) > 0 else pd.DataFrame()
+    df_approx = info.df_approx
+    if df_approx is not None:
+        seen = set(df_rows.index)
+        df_rows = df_rows.reindex(list(df_rows.index) + [cn for cn in df_approx.index if cn not in seen])
+        row_poss = pd.Series(np.arange(len(df_rows)), index=df_rows.index)
+        meta['tables']['df_approx'] = _profile_table_meta(df_approx, row_poss[df_approx.index].tolist())
+        df_rows = pd.concat([df_rows, _profile_table_stored(df_approx).reindex(df_rows.index)], axis=1)
+    else:
+        meta['tables']['df_approx'] = None
+    df_summary_ = info.df_summary
+    meta['tables']['df_summary'] = None if df_summary_ is None else OrderedDict([
+        ('columns', list(df_summary_.columns)), ('dtypes', [str(dtype) for dtype in df_summary_.dtypes]),
+        ('values', df_summary_.values.tolist())])
+
+    names = list(df_rows.index)
+    if len(set(type(name) for name in names)) > 1:  # mixed types can't go in one Parquet col
+        names = [str(name) for name in names]
+    df_rows = df_rows.reset_index(drop=True)
+    section = df_rows.pop('section') if 'section' in df_rows.columns else None
+    df_rows.insert(0, 'name', names)
+    df_rows.insert(0, 'section', section)
+    return df_rows, meta
+
+def _profile_table_stored(table, renames={}):
+    """
+    Copy of table as it's stored by to_parquet(): values of object cols (eg min, max, and
+    mostfreq of non-float cols, which mix types) as str, so each file's cols have the same types
+    whatever was profiled, and those of renames renamed (so they don't clash with float ones)
+    """
+    table = table.copy()
+    for cn in table.columns:
+        if table[cn].dtype == object:
+            present = table[cn].notna()
+            table[cn] = table[cn][present].map(str).reindex(table.index)
+    return table.rename(columns=renames)
+
+def _profile_table_meta(table, rows, renames={}):
+    return OrderedDict([('columns', list(table.columns)), ('dtypes', [str(dtype) for dtype in table.dtypes]),
+                        ('stored_columns', [renames.get(cn, cn) for cn in table.columns]), ('rows', list(rows))])
+
+def _profile_table_from_rows(df_rows, table_meta):
+    """Rebuilds one table (eg df_cols_other) from construct_from_parquet()'s df_rows"""
+    if table_meta is None:
+        return None
+    table = df_rows.iloc[table_meta['rows']].set_index('name')[table_meta['stored_columns']]
+    table.columns = table_meta['columns']
+    table.index.name = 'name'
+    dtypes = dict(zip(table_meta['columns'], table_meta['dtypes']))
+    table = table.astype(dtypes)
+    for cn in table.columns:
+        if dtypes[cn] == 'object':
+            table[cn] = table[cn].where(table[cn].notna(), np.nan)
+    if 'dtype' in table.columns:
+        _restore_profile_values(table, [cn for cn in table.columns if dtypes[cn] == 'object' and cn != 'dtype'])
+    return table
+
+def _restore_profile_values(table, cns):
+    """In place, converts cns' str values back to the type of each row's profiled col, where that's numeric, bool, or datetime"""
+    for dtype_str, poss in table.groupby('dtype', sort=False).indices.items():
+        try:
+            dtype = pd.api.types.pandas_dtype(dtype_str)
+        except TypeError:
+            continue
+        if dtype.kind not in 'biufmM':
+            continue
+        for cn in cns:
+            values = table[cn].values.copy()
+            subset = values[poss]
+            present = pd.notna(subset) & np.array([isinstance(value, str) for value in subset], dtype=bool)
+            if not present.any():
+                continue
+            strs = pd.Series(subset[present], dtype=object)
+            converted = strs == 'True' if dtype.kind == 'b' else strs.astype(dtype)
+            values[poss[present]] = converted.tolist()
+            table[cn] = values
+
+def _profile_meta(schema, full_file_path):
+    import json
+    if schema.metadata is None or PROFILE_META_KEY not in schema.metadata:
+        raise ValueError('{} was not written by DFFullInfo.to_parquet()'.format(full_file_path))
+    return json.loads(schema.metadata[PROFILE_META_KEY])
+
+
+
+# < Caching df_full_info results > ===========================================
+
+DF_FULL_INFO_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'defnotdatatools', 'df_full_info')
+DF_FULL_INFO_CACHE_MAX_DISK_BYTES = 2 ** 30
+DF_FULL_INFO_CACHE_MAX_MEM_ITEMS = 32
+
+def df_fingerprint(df):
+    """
+    Return hex str that changes whenever df's contents (values, index, col names, dtypes, and
+    the index's and cols' names, eg from rename_axis()) do.
+    Numeric cols' bytes are hashed as they are in memory (no copying), other cols through
+    pd.util.hash_pandas_object(), so it's far quicker than profiling df.
+    """
+    assert isinstance(df, pd.DataFrame)
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes], df.shape,
+                        list(df.index.names), list(df.columns.names))).encode())
+    hasher.update(pd.util.hash_pandas_object(df.index).values.tobytes())
+    for cn, ser in df.items():
+        values = ser.values
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'biufcmM':
+            hasher.update(np.ascontiguousarray(values).view(np.uint8))  # a uint8 view, since memoryview() rejects datetimes
+        else:
+            hasher.update(pd.util.hash_pandas_object(ser, index=False).values.tobytes())
+    return hasher.hexdigest()
+
+
+class DFFullInfoCache():
+    """
+    Cache of DFFullInfo results, keyed by df_fingerprint() of the df plus the df_full_info()
+    options that change results. Recently used results are kept in memory (up to max_mem_items),
+    and all are stored (pickled) in cache_dir, where the least recently used are deleted once
+    the files add up to more than max_disk_bytes. Only point cache_dir at files you trust.
+
+    Use its df_full_info(), or pass it as df_full_info(cache=...).
+    """
+
+    def __init__(self, cache_dir=DF_FULL_INFO_CACHE_DIR, max_disk_bytes=DF_FULL_INFO_CACHE_MAX_DISK_BYTES,
+                 max_mem_items=DF_FULL_INFO_CACHE_MAX_MEM_ITEMS):
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.max_mem_items = max_mem_items
+        self._mem = OrderedDict()  # key -> DFFullInfo, least recently used first
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def df_full_info(self, df, name='', **kwargs):
+        """df_full_info(), but only computed if it's not in the cache already"""
+        key = self.key(df, name=name, **kwargs)
+        info = self.get(key)
+        if info is None:
+            info = df_full_info(df=df, name=name, **kwargs)
+            self.put(key, info)
+        return info
+
+    def key(self, df, **kwargs):
+        """Returns cache key for df_full_info(df, **kwargs)"""
+        import inspect
+        bound_args = inspect.signature(df_full_info).bind(df, **kwargs)
+        bound_args.apply_defaults()
+        options = {k: v for k, v in bound_args.arguments.items()
+                   if k not in ('df', 'n_jobs', 'executor', 'cache')}  # those don't change results
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(df_fingerprint(df).encode())
+        hasher.update(repr(sorted(options.items())).encode())
+        return hasher.hexdigest()
+
+    def get(self, key):
+        """Returns cached DFFullInfo, or None if key isn't cached"""
+        if key in self._mem:
+            self._mem.move_to_end(key)
+            return self._mem[key]
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                info = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        os.utime(path)  # mark as recently used, for eviction
+        self._remember(key, info)
+        return info
+
+    def put(self, key, info):
+        """Stores DFFullInfo under key, in memory and on disk"""
+        assert isinstance(info, DFFullInfo)
+        tmp_path = self._path(key) + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(info, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))  # so a half-written file is never read
+        self._remember(key, info)
+        self._evict_from_disk()
+
+    def invalidate(self, key=None):
+        """Removes key from the cache, or if key is None, empties the cache"""
+        keys = list(self._mem) if key is None else [key]
+        if key is None:
+            keys += [fn[:-len('.pkl')] for fn in os.listdir(self.cache_dir) if fn.endswith('.pkl')]
+        for k in keys:
+            self._mem.pop(k, None)
+            try:
+                os.remove(self._path(k))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    def _remember(self, key, info):
+        self._mem[key] = info
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_mem_items:
+            self._mem.popitem(last=False)
+
+    def _evict_from_disk(self):
+        """Deletes least recently used files until they fit in max_disk_bytes"""
+        entries = [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith('.pkl')]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        total_bytes = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total_bytes <= self.max_disk_bytes:
+                break
+            total_bytes -= entry.stat().st_size
+            os.remove(entry.path)
+
+_default_cache = None
+
+def _get_default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DFFullInfoCache()
+    return _default_cache
+
+
+
+# < To get info about DataFrames quickly, from a sample of rows > ===========================================
+
+SAMPLE_CONFIDENCE = .95  # confidence level of the intervals df_full_info() reports when sampling
+SAMPLE_PILOT_ROWS = 1000  # rows of the first pilot profiled to see how many rows fit in a sample_secs budget
+SAMPLE_PILOT_GROWTH = 4  # each pilot has this many times the rows of the last one
+
+def _sampled_df_full_info(df, name, sample_rows, sample_secs, stratify_by, exact_minmax, seed,
+                          n_jobs, executor):
+    """
+    Does df_full_info() from a sample of df's rows, with a df_approx table of confidence intervals.
+    The sample is uniform, or if stratify_by (a col name) is given, stratified with each value of
+    that col getting its proportional share of rows. As the shares are proportional, the sample's
+    estimates need no weighting, and df_approx's intervals (from the uniform sample formulas) are
+    conservative: stratifying can only narrow them. See df_full_info() for the other args.
+    """
+    timer = timing.Timer()
+    rng = np.random.default_rng(seed)
+    if sample_rows is None:
+        sample_rows = len(df)
+    sample_rows = min(sample_rows, len(df))
+    if sample_rows < len(df) or sample_secs is not None:  # the full passes count against sample_secs too
+        exact = _exact_counts_and_minmax(df) if exact_minmax else {}
+        summary = df_summary(df)
+    def profile_sample(rows):
+        """Return (df_cols_float, df_cols_other, df_approx) of a sample of rows rows"""
+        df_sample = df.take(_sample_row_idxs(df, rows, stratify_by, rng))
+        sample_info = DFFullInfo(df=df_sample, name=name, n_jobs=n_jobs, executor=executor)
+        df_cols_float = _unsample_cols_info(sample_info.df_cols_float, nrows=len(df), exact=exact)
+        df_cols_other = _unsample_cols_info(sample_info.df_cols_other, nrows=len(df), exact=exact)
+        return df_cols_float, df_cols_other, _sample_approx_df(df_sample, df_cols_float, df_cols_other,
+                                                               nrows=len(df), exact=exact)
+
+    if sample_secs is not None:
+        sample_rows = _sample_rows_in_secs(profile_sample, sample_rows, sample_secs - timer.check_num(units='secs'))
+    if sample_rows >= len(df):
+        return DFFullInfo(df=df, name=name, n_jobs=n_jobs, executor=executor)
+
+    df_cols_float, df_cols_other, df_approx = profile_sample(sample_rows)
+    return DFFullInfo.construct_from_tables(df_summary=summary, df_cols_float=df_cols_float,
+                                            df_cols_other=df_cols_other, name=name, df_approx=df_approx)
+
+def _sample_rows_in_secs(profile_sample, max_rows, secs):
+    """
+    Number of rows (at most max_rows) that profile_sample(rows) does in what's left of secs,
+    from pilot samples growing by SAMPLE_PILOT_GROWTH. Small pilots are mostly fixed per-col
+    costs, so the per-row rate is from the difference between the last two, and pilots go on
+    while the next one is cheap and still well short of the sample the rate allows.
+    """
+    timer = timing.Timer()
+    pilots = []  # (rows, secs)
+    rows = min(max_rows, SAMPLE_PILOT_ROWS)
+    rows_in_secs = rows
+    while rows < max_rows:
+        timer.start()
+        profile_sample(rows)
+        pilots.append((rows, max(timer.check_num(units='secs'), 1e-6)))
+        secs -= pilots[-1][1]
+        row_secs, fixed_secs = pilots[-1][1] / rows, 0.
+        if len(pilots) > 1 and pilots[-1][1] > pilots[-2][1]:
+            row_secs = (pilots[-1][1] - pilots[-2][1]) / (rows - pilots[-2][0])
+            fixed_secs = pilots[-1][1] - row_secs * rows
+        rows_in_secs = max(rows, int((secs - fixed_secs) / row_secs))
+        next_rows = rows * SAMPLE_PILOT_GROWTH
+        if len(pilots) == 1:  # one pilot can't tell fixed from per-row costs, so a second unless it's costly
+            if pilots[-1][1] * SAMPLE_PILOT_GROWTH > secs:
+                break
+        elif next_rows * SAMPLE_PILOT_GROWTH > rows_in_secs or (fixed_secs + row_secs * next_rows) * 4 > secs:
+            break
+        rows = next_rows
+    return min(max_rows, rows_in_secs)  # never more than asked for
+
+def _sample_row_idxs(df, n, stratify_by, rng):
+    """Sorted positions of n rows to sample from df (without replacement, in O(n) memory if uniform)"""
+    if stratify_by is None:
+        return np.sort(rng.choice(len(df), size=n, replace=False))
+    idxs_lst = []
+    for group_idxs in df.groupby(stratify_by, sort=False).indices.values():
+        n_group = int(round(n * len(group_idxs) / len(df)))
+        idxs_lst.append(rng.choice(group_idxs, size=min(n_group, len(group_idxs)), replace=False))
+    return np.sort(np.concatenate(idxs_lst))
+
+def _exact_counts_and_minmax(df):
+    """
+    Return dict of col name -> (count, min, max), from a full pass over df's numeric, bool, and
+    datetime cols, which is cheap (unlike for object cols)
+    """
+    exact = {}
+    for cn, ser in df.items():  # col by col, since select_dtypes() would copy whole blocks
+        dtype = ser.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            values = ser.values
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN cols
+                exact[cn] = (len(values) - np.isnan(values).sum(), np.nanmin(values), np.nanmax(values))
+        elif (pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)
+              or pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype)):
+            exact[cn] = (ser.count(), ser.min(), ser.max())
+    return exact
+
+def _unsample_cols_info(df_cols, nrows, exact):
+    """Makes a cols_info_ table of a sample stand for the full df of nrows"""
+    if df_cols is None:
+        return None
+    df_cols = df_cols.copy()
+    df_cols['miss_ct'] = (nrows * (1 - df_cols['filled_pct'])).round().astype(np.int64)
+    for cn in df_cols.index:
+        if cn in exact:
+            count, col_min, col_max = exact[cn]
+            df_cols.loc[cn, 'filled_pct'] = count / nrows
+            df_cols.loc[cn, 'miss_ct'] = nrows - count
+            df_cols.at[cn, 'min'] = col_min
+            df_cols.at[cn, 'max'] = col_max
+    if 'min_medADs' in df_cols.columns:  # float cols: from the exact min and max, like cols_info_float()
+        med_AD = df_cols['medAD'].where(df_cols['medAD'] != 0)
+        df_cols['min_medADs'] = (df_cols['median'] - df_cols['min'].astype(np.float64)) / med_AD
+        df_cols['max_medADs'] = (df_cols['max'].astype(np.float64) - df_cols['median']) / med_AD
+    return df_cols
+
+def _sample_approx_df(df_sample, df_cols_float, df_cols_other, nrows, exact):
+    """
+    Return df of how good the sample's estimates are, one row per col:
+        sample_rows: rows in the sample
+        filled_pct_lo, filled_pct_hi: Wilson score interval of filled_pct (exact if lo == hi)
+        minmax_exact: whether min and max are from a full pass (otherwise they're the sample's)
+        mean_lo, mean_hi: normal-approx. interval of mean (float cols)
+        05_pctile_lo, ..., 95_pctile_hi: distribution-free (order statistic) interval of each pctile
+            (float cols; median is 50_pctile)
+        nunique_sample: distinct values seen in the sample (non-float cols; that's what nunique is)
+        nunique_est: estimated distinct values in the full df, by the GEE estimator
+            (Charikar et al. 2000), which is within a factor of sqrt(nrows/sample_rows)
+    All intervals are at SAMPLE_CONFIDENCE.
+    """
+    import statistics
+    n = len(df_sample)
+    z = statistics.NormalDist().inv_cdf(.5 + SAMPLE_CONFIDENCE / 2)
+    fpc = np.sqrt(1 - n / nrows)  # finite population correction
+    odicts_lst = []
+    for df_cols in (df_cols_float, df_cols_other):
+        if df_cols is None:
+            continue
+        for cn, row in df_cols.iterrows():
+            info_pairs = OrderedDict([('name', cn), ('sample_rows', n)])
+            if cn in exact:
+                info_pairs['filled_pct_lo'] = info_pairs['filled_pct_hi'] = row['filled_pct']
+            else:
+                info_pairs['filled_pct_lo'], info_pairs['filled_pct_hi'] = _wilson_interval(row['filled_pct'], n, z)
+            info_pairs['minmax_exact'] = cn in exact
+            odicts_lst.append(info_pairs)
+    df_approx = pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys()).set_index('name')
+
+    if df_cols_float is not None:
+        sorted_values = np.sort(df_sample[df_cols_float.index].values.astype(np.float64), axis=0)
+        count = n - np.isnan(sorted_values).sum(axis=0)
+        half_width = z * df_cols_float['std'].values / np.sqrt(count) * fpc
+        df_approx.loc[df_cols_float.index, 'mean_lo'] = df_cols_float['mean'].values - half_width
+        df_approx.loc[df_cols_float.index, 'mean_hi'] = df_cols_float['mean'].values + half_width
+        cols = np.arange(len(count))
+        for key, q in FLOAT_PCTILES.items():
+            rank_half_width = z * np.sqrt(count * q * (1 - q))
+            lo_rank = np.clip(np.floor(count * q - rank_half_width), 0, np.maximum(count - 1, 0))
+            hi_rank = np.clip(np.ceil(count * q + rank_half_width), 0, np.maximum(count - 1, 0))
+            df_approx.loc[df_cols_float.index, key + '_lo'] = np.where(
+                count > 0, sorted_values[lo_rank.astype(np.intp), cols], np.nan)
+            df_approx.loc[df_cols_float.index, key + '_hi'] = np.where(
+                count > 0, sorted_values[hi_rank.astype(np.intp), cols], np.nan)
+
+    if df_cols_other is not None:
+        for cn in df_cols_other.index:
+            value_counts = df_sample[cn].value_counts()
+            value_counts = value_counts[value_counts > 0]  # categoricals list unused categories too
+            n_singletons = (value_counts == 1).sum()
+            df_approx.loc[cn, 'nunique_sample'] = len(value_counts)
+            df_approx.loc[cn, 'nunique_est'] = round(np.sqrt(nrows / n) * n_singletons +
+                                                     len(value_counts) - n_singletons)
+    return df_approx
+
+def _wilson_interval(p, n, z):
+    """Wilson score interval (lo, hi) for a proportion p seen in n trials"""
+    center = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half_width = z / (1 + z * z / n) * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+    return center - half_width, center + half_width
+
+
+
+# < To get info about DataFrames too big for memory > ===========================================
+
+STREAM_CHUNKSIZE = 1000000  # rows per chunk read by df_full_info_file()
+
+def df_full_info_file(path, name=None, chunksize=STREAM_CHUNKSIZE, **read_kwargs):
+    """
+    Like df_full_info(), but for a CSV or Parquet file (or dir of Parquet files) too big to load:
+    reads it chunksize rows at a time, so memory stays bounded. Parquet is read with pyarrow.
+
+    Exact: nrows, filled_pct, miss_ct, min, max, mean, std, zeros_pct. Approximate (see the
+    returned DFFullInfo's .df_approx for error bounds): median, pctiles, medAD, MAD, nunique,
+    mostfreq's pcts (and which values are mostfreq, if it's close).
+
+    Args:
+        read_kwargs: passed to pd.read_csv() (eg dtype=, to keep a col's dtype the same across chunks)
+    """
+    misc.validate_path(path)
+    if name is None:
+        name = os.path.basename(path.rstrip(os.sep))
+    return df_full_info_chunks(_read_chunks(path, chunksize=chunksize, **read_kwargs), name=name)
+
+def df_full_info_chunks(chunks, name=''):
+    """Like df_full_info(), but for an iterable of DataFrames (chunks of one big df, in row order)"""
+    accumulator = DFInfoAccumulator()
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.to_df_full_info(name=name)
+
+def _read_chunks(path, chunksize, **read_kwargs):
+    """Yields DataFrames of chunksize rows from a CSV or Parquet file (or dir of Parquet files)"""
+    if os.path.isdir(path) or os.path.splitext(path)[1].lower() in ('.parquet', '.pq'):
+        import pyarrow.dataset  # optional dependency, only needed for Parquet
+        for batch in pyarrow.dataset.dataset(path, format='parquet').to_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        for chunk in pd.read_csv(path, chunksize=chunksize, **read_kwargs):
+            yield chunk
+
+
+class DFInfoAccumulator():
+    """
+    Mergeable summaries of a DataFrame that's seen chunk by chunk (update()), or in pieces
+    summarized separately and then combined (merge()). to_df_full_info() turns them into the same
+    DFFullInfo that df_full_info() would give for the whole df, but with memory bounded by the
+    number of cols rather than rows. Uses defnotdatatools.sketch for the approximate fields.
+    """
+
+    def __init__(self):
+        self.nrows = 0
+        self.memory_bytes = 0
+        self.index_name = None
+        self.cols = OrderedDict()  # col name -> OrderedDict of that col's summaries
+
+    def update(self, df):
+        """Folds a chunk of rows into the summaries"""
+        assert isinstance(df, pd.DataFrame)
+        if self.nrows == 0:
+            self.index_name = df.index.name
+        self.nrows += len(df)
+        self.memory_bytes += df_memory_info(df, find_dups=False)['deep_bytes'].sum()
+        for cn, ser in df.items():
+            self._update_col(cn, ser)
+
+    def merge(self, other):
+        """Folds another DFInfoAccumulator (of later rows of the same df) into this one"""
+        assert isinstance(other, DFInfoAccumulator)
+        if self.nrows == 0:
+            self.index_name = other.index_name
+        self.nrows += other.nrows
+        self.memory_bytes += other.memory_bytes
+        for cn, other_col in other.cols.items():
+            if cn not in self.cols:
+                self.cols[cn] = _new_col_summaries(dtype=other_col['dtype'])
+            _merge_col_summaries(self.cols[cn], other_col, cn=cn)
+
+    def _update_col(self, cn, ser):
+        ser = ser.dropna()
+        col = self.cols.get(cn)
+        if col is None or col['count'] == 0:  # (re)decide col's kind when it first has values
+            col = self.cols[cn] = _new_col_summaries(dtype=ser.dtype)
+        if len(ser) == 0:
+            return
+        chunk = _new_col_summaries(dtype=ser.dtype)
+        chunk['count'] = len(ser)
+        if isinstance(ser.dtype, pd.CategoricalDtype) and not ser.cat.ordered:
+            # unordered categories have no min or max, so like ser_info_factorized(), use the used ones' values
+            used_categories = pd.Series(ser.cat.categories[np.unique(ser.cat.codes.values)])
+            chunk['min'], chunk['max'] = used_categories.min(), used_categories.max()
+        else:
+            chunk['min'], chunk['max'] = ser.min(), ser.max()
+        if 'numeric' in chunk:
+            values = ser.values.astype(np.float64)
+            numeric = chunk['numeric']
+            numeric['mean'] = values.mean()
+            numeric['m2'] = np.square(values - numeric['mean']).sum()
+            numeric['zeros'] = np.count_nonzero(values == 0)
+            numeric['quantiles'].update(values)
+        if 'distinct' in chunk:
+            chunk['distinct'].update(ser)
+            chunk['freqs'].update(ser)
+        _merge_col_summaries(col, chunk, cn=cn)
+
+    def to_df_full_info(self, name=''):
+        """Returns DFFullInfo of everything seen so far, with a df_approx table of error bounds"""
+        return DFFullInfo.construct_from_tables(name=name, **self._tables())
+
+    def _tables(self):
+        """Returns dict of DFFullInfo.construct_from_tables() args, except name"""
+        float_cns = [cn for cn, col in self.cols.items() if col['is_float']]
+        other_cns = [cn for cn, col in self.cols.items() if not col['is_float']]
+        dtypes = pd.Series([col['dtype'] for col in self.cols.values()])
+        summary = _summary_df(nrows=self.nrows, ncols=len(self.cols), index_name=self.index_name,
+                              memory_bytes=self.memory_bytes, dtypes=dtypes)
+        df_cols_float = None
+        if len(float_cns) > 0:
+            info = self._float_info(float_cns)
+            df_cols_float = _float_info_df(info, names=float_cns,
+                                           dtypes=[self.cols[cn]['dtype'] for cn in float_cns])
+        df_cols_other = None
+        if len(other_cns) > 0:
+            odicts_lst = [self._other_info(cn) for cn in other_cns]
+            df_cols_other = pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys()).set_index('name')
+            df_cols_other['dtype'] = [self.cols[cn]['dtype'] for cn in other_cns]
+        return dict(df_summary=summary, df_cols_float=df_cols_float, df_cols_other=df_cols_other,
+                    df_approx=self._approx_df())
+
+    def _float_info(self, float_cns):
+        """float_block_info()-style info for the float cols"""
+        info = OrderedDict((key, np.full(len(float_cns), np.nan)) for key in FLOAT_INFO_KEYS)
+        for i, cn in enumerate(float_cns):
+            col = self.cols[cn]
+            count = col['count']
+            info['filled_pct'][i] = count / self.nrows if self.nrows > 0 else np.nan
+            if count == 0:
+                continue
+            numeric = col['numeric']
+            quantiles = numeric['quantiles']
+            median = quantiles.quantile(.5)
+            items, weights = quantiles.items_and_weights()
+            if quantiles.is_exact():
+                med_AD = np.median(np.abs(items - median))
+            else:
+                abs_devs = np.abs(items - median)
+                order = np.argsort(abs_devs, kind='mergesort')
+                med_AD = sketch._weighted_quantile(abs_devs[order], weights[order], .5)
+            info['min'][i] = col['min']
+            info['max'][i] = col['max']
+            if med_AD != 0:
+                info['min_medADs'][i] = (median - col['min']) / med_AD
+                info['max_medADs'][i] = (col['max'] - median) / med_AD
+            info['medAD'][i] = med_AD
+            info['MAD'][i] = np.sum(weights * np.abs(items - numeric['mean'])) / np.sum(weights)
+            info['median'][i] = median
+            info['mean'][i] = numeric['mean']
+            info['std'][i] = np.sqrt(numeric['m2'] / (count - 1)) if count > 1 else np.nan
+            for key, q in FLOAT_PCTILES.items():
+                info[key][i] = quantiles.quantile(q)
+            info['zeros_pct'][i] = numeric['zeros'] / count
+        info['miss_ct'] = np.array([self.nrows - self.cols[cn]['count'] for cn in float_cns])
+        return info
+
+    def _other_info(self, cn):
+        """ser_info_any() plus ser_info_other()-style OrderedDict for a non-float col"""
+        col = self.cols[cn]
+        count = col['count']
+        info_pairs = OrderedDict()
+        info_pairs['name'] = cn
+        info_pairs['filled_pct'] = count / self.nrows if self.nrows > 0 else np.nan
+        info_pairs['miss_ct'] = self.nrows - count
+        info_pairs['min'] = col['min'] if count > 0 else np.nan
+        info_pairs['max'] = col['max'] if count > 0 else np.nan
+        freqs = col['freqs']
+        info_pairs['nunique'] = len(freqs.counts) if freqs.is_exact() else col['distinct'].estimate()
+        n_mostfreq = 3
+        value_counts = freqs.top(n_mostfreq)
+        for i in range(n_mostfreq):
+            if i+1 > len(value_counts):  # if there are fewer than 3 values in series, use nan
+                info_pairs['mostfreq' + str(i+1)] = np.nan
+                info_pairs['mf' + str(i+1) + '_pct'] = np.nan
+            else:
+                info_pairs['mostfreq' + str(i+1)] = value_counts.index[i]
+                info_pairs['mf' + str(i+1) + '_pct'] = value_counts.iloc[i] / count
+        return info_pairs
+
+    def _approx_df(self):
+        """
+        Return df of error bounds of approximate fields, one row per col (0 means exact):
+            pctiles_rank_err: median and *_pctile are within this many quantiles (eg .005) of
+                the true rank (99% confidence)
+            medADs_MAD_exact: whether medAD, MAD, min_medADs, max_medADs are exact (if not, they're
+                computed from the pctiles' sketch, and have no guaranteed bound)
+            nunique_rel_err: relative standard error of nunique
+            mf_pct_err: mf1_pct..mf3_pct may each be short by up to this much
+        """
+        odicts_lst = []
+        for cn, col in self.cols.items():
+            info_pairs = OrderedDict([('name', cn), ('pctiles_rank_err', np.nan),
+                                      ('medADs_MAD_exact', np.nan),
+                                      ('nunique_rel_err', np.nan), ('mf_pct_err', np.nan)])
+            if col['is_float']:
+                quantiles = col['numeric']['quantiles']
+                info_pairs['pctiles_rank_err'] = quantiles.rank_error()
+                info_pairs['medADs_MAD_exact'] = quantiles.is_exact()
+            else:
+                freqs = col['freqs']
+                info_pairs['nunique_rel_err'] = 0. if freqs.is_exact() else col['distinct'].rel_error()
+                info_pairs['mf_pct_err'] = freqs.count_error() / col['count'] if col['count'] > 0 else 0.
+            odicts_lst.append(info_pairs)
+        if len(odicts_lst) == 0:
+            return None
+        return pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys()).set_index('name')
+
+class IncrementalDFFullInfo(DFFullInfo):
+    """
+    DFFullInfo that keeps a DFInfoAccumulator of mergeable summaries next to its tables, so
+    that when rows get appended to the df, update() with just the new rows brings the tables up to
+    date in time proportional to the new rows. merge() adds another IncrementalDFFullInfo's rows.
+    Fields are exact until the sketches fill up, then approximate (see df_approx).
+
+    To keep going after a restart, to_state_file() saves the summaries, and
+    construct_from_state_file() makes an IncrementalDFFullInfo from them (pickle, so only load
+    files you trust).
+    """
+
+    def __init__(self, df, name=''):
+        self.accumulator = DFInfoAccumulator()
+        self.accumulator.update(df)
+        self._set_tables(name=name, **self.accumulator._tables())
+
+    @classmethod
+    def construct_from_state_file(cls, full_file_path):
+        """Alternate constructor from a file written by to_state_file()"""
+        with open(full_file_path, 'rb') as f:
+            name, accumulator = pickle.load(f)
+        assert isinstance(accumulator, DFInfoAccumulator)
+        new_info = cls.__new__(cls)
+        new_info.accumulator = accumulator
+        new_info._set_tables(name=name, **accumulator._tables())
+        return new_info
+
+    def update(self, new_rows_df):
+        """Folds rows appended to the df into the info"""
+        self.accumulator.update(new_rows_df)
+        self._set_tables(name=self.name, **self.accumulator._tables())
+
+    def merge(self, other_info):
+        """Folds another IncrementalDFFullInfo (of other rows of the same df) into this one"""
+        assert isinstance(other_info, IncrementalDFFullInfo)
+        self.accumulator.merge(other_info.accumulator)
+        self._set_tables(name=self.name, **self.accumulator._tables())
+
+    def to_state_file(self, full_file_path):
+        """Writes the mergeable summaries to file, for construct_from_state_file()"""
+        with open(full_file_path, 'wb') as f:
+            pickle.dump((self.name, self.accumulator), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _new_col_summaries(dtype):
+    """
+    Return OrderedDict of empty summaries for a col of passed dtype. Float and int cols get
+    'numeric' summaries (so an int col can still become a float col if a later chunk has NaNs),
+    non-float cols get 'distinct' and 'freqs' sketches.
+    """
+    col = OrderedDict()
+    col['dtype'] = str(dtype)
+    col['is_float'] = _is_float_dtype(dtype)
+    col['count'] = 0
+    col['min'] = None
+    col['max'] = None
+    if col['is_float'] or _is_int_dtype(dtype):
+        col['numeric'] = OrderedDict([('mean', 0.), ('m2', 0.), ('zeros', 0),
+                                      ('quantiles', sketch.QuantileSketch())])
+    if not col['is_float']:
+        col['distinct'] = sketch.DistinctSketch()
+        col['freqs'] = sketch.HeavyHitters()
+    return col
+
+def _merge_col_summaries(col, other, cn):
+    """Folds other col summaries (of later rows of the same col) into col's"""
+    if other['count'] == 0:
+        return
+    if col['count'] == 0:  # nothing to keep yet, so just take on the other's kind
+        col.clear()
+        col.update(_new_col_summaries(dtype=other['dtype']))
+    if other['is_float'] and not col['is_float']:
+        if 'numeric' not in col:
+            raise ValueError("Col '{}' changed from {} to {} between chunks; pass a dtype to keep "
+                             "it the same".format(cn, col['dtype'], other['dtype']))
+        col['is_float'] = True  # an int col that's gotten NaNs: it's a float col from here on
+        col['dtype'] = other['dtype']
+        del col['distinct']
+        del col['freqs']
+    elif 'numeric' in col and 'numeric' not in other:
+        if col['is_float']:
+            raise ValueError("Col '{}' changed from {} to {} between chunks; pass a dtype to keep "
+                             "it the same".format(cn, col['dtype'], other['dtype']))
+        del col['numeric']
+        col['dtype'] = 'object'
+
+    count = col['count'] + other['count']
+    if 'numeric' in col:  # Chan et al.'s parallel algorithm for mean and sum of squared deviations
+        numeric = col['numeric']
+        other_numeric = other['numeric']
+        delta = other_numeric['mean'] - numeric['mean']
+        numeric['mean'] += delta * other['count'] / count
+        numeric['m2'] += other_numeric['m2'] + delta ** 2 * col['count'] * other['count'] / count
+        numeric['zeros'] += other_numeric['zeros']
+        numeric['quantiles'].merge(other_numeric['quantiles'])
+    if 'distinct' in col:
+        col['distinct'].merge(other['distinct'])
+        col['freqs'].merge(other['freqs'])
+    col['min'] = other['min'] if col['min'] is None else min(col['min'], other['min'])
+    col['max'] = other['max'] if col['max'] is None else max(col['max'], other['max'])
+    col['count'] = count
+
+def _is_float_dtype(dtype):
+    return pd.api.types.is_float_dtype(dtype)
+
+def _is_int_dtype(dtype):
+    return pd.api.types.is_integer_dtype(dtype)
+
+
+
+# < To get info about Parquet datasets from their metadata > ===========================================
+
+PARQUET_FOOTER_STATS = ('filled_pct', 'miss_ct', 'min', 'max')  # what Parquet footers give without reading data
+PARQUET_OTHER_STATS = ('nunique', 'mostfreq1', 'mf1_pct', 'mostfreq2', 'mf2_pct', 'mostfreq3', 'mf3_pct')
+
+def df_full_info_parquet(path, name=None, stats=PARQUET_FOOTER_STATS, n_jobs=1, footer_info=None,
+                         chunksize=STREAM_CHUNKSIZE):
+    """
+    Like df_full_info_file(), but for a Parquet file or (hive-partitioned) dir of them, and just the
+    stats asked for: filled_pct, miss_ct, min and max (and nrows) come from the files' footers
+    (row group statistics), without reading any data. Other stats (any of FLOAT_INFO_KEYS and
+    PARQUET_OTHER_STATS) are computed like df_full_info_file() does, reading only the cols they're
+    for: float cols for FLOAT_INFO_KEYS, other cols for PARQUET_OTHER_STATS. memory_usage is the
+    data's uncompressed size, from the footers.
+
+    For the same footer stats per partition (file), see parquet_footer_info().
+
+    Args:
+        stats: stats to have in df_cols_float and df_cols_other
+        n_jobs: number of partitions to do at once, in a thread pool (-1 means one per CPU)
+        footer_info: parquet_footer_info() of path, if you have it already
+    """
+    unknown_stats = set(stats) - set(PARQUET_FOOTER_STATS) - set(FLOAT_INFO_KEYS) - set(PARQUET_OTHER_STATS)
+    if len(unknown_stats) > 0:
+        raise ValueError('Unknown stats: ' + ', '.join(sorted(unknown_stats)))
+    import pyarrow.dataset  # optional dependency, only needed for Parquet
+    misc.validate_path(path)
+    if name is None:
+        name = os.path.basename(path.rstrip(os.sep))
+    dataset = pyarrow.dataset.dataset(path, format='parquet', partitioning='hive')
+    if footer_info is None:
+        footer_info = parquet_footer_info(path, n_jobs=n_jobs)
+    dtypes = dataset.schema.empty_table().to_pandas().dtypes
+    float_cns = [cn for cn, dtype in dtypes.items() if _is_float_dtype(dtype)]
+    other_cns = [cn for cn, dtype in dtypes.items() if not _is_float_dtype(dtype)]
+
+    read_cns = []
+    if len(set(stats) - set(PARQUET_FOOTER_STATS) & set(FLOAT_INFO_KEYS)) > 0:
+        read_cns += float_cns
+    if len(set(stats) & set(PARQUET_OTHER_STATS)) > 0:
+        read_cns += other_cns
+    read_tables = {}
+    if len(read_cns) > 0:
+        fragments = list(dataset.get_fragments())
+        read_fn = lambda fragment: _parquet_fragment_accumulator(fragment, dataset.schema, read_cns, chunksize)
+        if _n_workers(n_jobs) > 1 and len(fragments) > 1:
+            with ThreadPoolExecutor(max_workers=_n_workers(n_jobs)) as pool:
+                accumulators = list(pool.map(read_fn, fragments))  # map() keeps partition order
+        else:
+            accumulators = [read_fn(fragment) for fragment in fragments]
+        accumulator = DFInfoAccumulator()
+        for fragment_accumulator in accumulators:
+            accumulator.merge(fragment_accumulator)
+        read_tables = accumulator._tables()
+
+    by_col = footer_info.groupby(level='name', sort=False)
+    nrows = int(footer_info['nrows'].groupby(level='partition', sort=False).first().sum())
+    footer_df = pd.DataFrame(OrderedDict([
+        ('filled_pct', 1 - by_col['miss_ct'].sum() / max(nrows, 1)), ('miss_ct', by_col['miss_ct'].sum()),
+        ('min', by_col['min'].agg(_min_of_present)), ('max', by_col['max'].agg(_max_of_present))]))
+    tables = OrderedDict()
+    for key, cns, all_keys in (('df_cols_float', float_cns, FLOAT_INFO_KEYS),
+                               ('df_cols_other', other_cns, list(PARQUET_FOOTER_STATS) + list(PARQUET_OTHER_STATS))):
+        if len(cns) == 0:
+            tables[key] = None
+            continue
+        table = read_tables.get(key)
+        if table is None:
+            table = footer_df.loc[cns]
+            table.index.name = 'name'
+        table = table[[cn for cn in all_keys if cn in stats and cn in table.columns]].copy()
+        table['dtype'] = [str(dtypes[cn]) for cn in cns]
+        tables[key] = table
+    summary = _summary_df(nrows=nrows, ncols=len(dtypes), index_name=None,
+                          memory_bytes=footer_info['uncompressed_bytes'].sum(), dtypes=dtypes)
+    return DFFullInfo.construct_from_tables(df_summary=summary, name=name, df_approx=read_tables.get('df_approx'),
+                                            **tables)
+
+def parquet_footer_info(path, n_jobs=1):
+    """
+    Return df of each partition (file) of a Parquet file or (hive-partitioned) dir of them, from
+    their footers, one row per partition and col: index (partition, name), then nrows, miss_ct,
+    filled_pct, min, max, uncompressed_bytes, and from_footer, which is False where some row group
+    had no statistics for the col, so the col was read (just that col, of just that file) for them.
+    Partition key cols (from dir names) have their one value as min and max.
+
+    Args:
+        n_jobs: number of partitions to do at once, in a thread pool (-1 means one per CPU)
+    """
+    import pyarrow.dataset  # optional dependency, only needed for Parquet
+    misc.validate_path(path)
+    dataset = pyarrow.dataset.dataset(path, format='parquet', partitioning='hive')
+    fragments = list(dataset.get_fragments())
+    if _n_workers(n_jobs) > 1 and len(fragments) > 1:
+        with ThreadPoolExecutor(max_workers=_n_workers(n_jobs)) as pool:
+            odicts_lsts = list(pool.map(lambda fragment: _parquet_fragment_footer_info(fragment, path), fragments))
+    else:
+        odicts_lsts = [_parquet_fragment_footer_info(fragment, path) for fragment in fragments]
+    odicts_lst = [odict for odicts in odicts_lsts for odict in odicts]
+    if len(odicts_lst) == 0:
+        return pd.DataFrame(columns=['nrows', 'miss_ct', 'filled_pct', 'min', 'max', 'uncompressed_bytes', 'from_footer'],
+                            index=pd.MultiIndex.from_arrays([[], []], names=['partition', 'name']))
+    return pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys()).set_index(['partition', 'name'])
+
+def _parquet_fragment_footer_info(fragment, path):
+    """parquet_footer_info() rows (list of OrderedDicts) of one file"""
+    import pyarrow.compute
+    import pyarrow.dataset
+    metadata = fragment.metadata
+    partition = os.path.relpath(fragment.path, path) if os.path.isdir(path) else os.path.basename(fragment.path)
+    odicts = []
+    for i in range(metadata.num_columns):
+        cn = metadata.schema.column(i).path
+        if '.' in cn:  # a field of a nested col
+            continue
+        miss_ct, mins, maxs, uncompressed_bytes, from_footer = 0, [], [], 0, True
+        for rg_i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg_i)
+            col_chunk = row_group.column(i)
+            uncompressed_bytes += col_chunk.total_uncompressed_size
+            col_stats = col_chunk.statistics
+            if col_stats is None or not col_stats.has_null_count:
+                from_footer = False
+                break
+            miss_ct += col_stats.null_count
+            if col_stats.has_min_max:
+                mins.append(col_stats.min)
+                maxs.append(col_stats.max)
+            elif col_stats.null_count < row_group.num_rows:
+                from_footer = False
+                break
+        if not from_footer:  # read just this col to get its stats
+            values = fragment.to_table(columns=[cn]).column(cn)
+            miss_ct = values.null_count
+            try:
+                min_max = pyarrow.compute.min_max(values).as_py()
+                mins, maxs = [min_max['min']], [min_max['max']]
+            except (pyarrow.ArrowNotImplementedError, pyarrow.ArrowTypeError):
+                mins, maxs = [], []
+        odicts.append(OrderedDict([
+            ('partition', partition), ('name', cn), ('nrows', metadata.num_rows), ('miss_ct', miss_ct),
+            ('filled_pct', 1 - miss_ct / metadata.num_rows if metadata.num_rows > 0 else np.nan),
+            ('min', _min_of_present(mins)), ('max', _max_of_present(maxs)),
+            ('uncompressed_bytes', uncompressed_bytes), ('from_footer', from_footer)]))
+    for cn, value in pyarrow.dataset.get_partition_keys(fragment.partition_expression).items():
+        miss_ct = metadata.num_rows if value is None else 0
+        odicts.append(OrderedDict([
+            ('partition', partition), ('name', cn), ('nrows', metadata.num_rows), ('miss_ct', miss_ct),
+            ('filled_pct', 1 - miss_ct / metadata.num_rows if metadata.num_rows > 0 else np.nan),
+            ('min', value), ('max', value), ('uncompressed_bytes', 0), ('from_footer', True)]))
+    return odicts
+
+def _parquet_fragment_accumulator(fragment, schema, cns, chunksize):
+    """DFInfoAccumulator of cns of one file (including any partition key cols)"""
+    accumulator = DFInfoAccumulator()
+    for batch in fragment.to_batches(schema=schema, columns=cns, batch_size=chunksize):
+        accumulator.update(batch.to_pandas())
+    return accumulator
+
+def _min_of_present(values):
+    values = [value.decode() if isinstance(value, bytes) else value for value in values if not pd.isna(value)]
+    return min(values) if len(values) > 0 else np.nan
+
+def _max_of_present(values):
+    values = [value.decode() if isinstance(value, bytes) else value for value in values if not pd.isna(value)]
+    return max(values) if len(values) > 0 else np.nan
+
+
+
+# < To get info about memory use > ===========================================
+
+MEMORY_SAMPLE_ROWS = 1000  # deep memory of object cols is estimated from this many of their values
+MEMORY_MAX_ITEMS = 1000  # deep_sizeof() estimates bigger containers from this many of their items
+MEMORY_ATOMIC_TYPES = (str, bytes, int, float, bool, complex, type(None))
+MEMORY_SHALLOW_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                        types.MethodType)  # deep_sizeof() doesn't follow these, they're shared
+
+def df_memory_info(df, sample_rows=MEMORY_SAMPLE_ROWS, find_dups=True):
+    """
+    Return df of memory use of passed DataFrame, one row for the index and one per col (with
+    find_dups=False, dup_of is left blank, which skips reading every value of some cols):
+        shallow_bytes: what df.memory_usage() says, ie buffers only (8 bytes per object value)
+        deep_bytes: shallow_bytes plus the objects that object values point to, estimated from
+            sample_rows of them when there are more (None for all, like memory_usage(deep=True))
+        deep_pct: % of the total deep_bytes
+        shares_with: other cols whose values are the same buffer as this col's (eg views)
+        dup_of: an earlier col with identical values, in a buffer of its own
+        dup_values_pct: % of sampled object values equal to an earlier value but separate
+            objects, ie what astype('category') would save
+    """
+    assert isinstance(df, pd.DataFrame)
+    rng = np.random.default_rng(0)
+    rows = OrderedDict()
+    rows['(index)'] = _values_memory_info(df.index, sample_rows=sample_rows, rng=rng)
+    data_addrs = OrderedDict()  # (address, strides, dtype) -> col names
+    sample_hashes = OrderedDict()  # (dtype, hash of sampled values) -> col positions
+    full_hashes = {}  # col position -> _values_digest(), only for cols whose sample hash matched
+    sample_idxs = np.sort(rng.choice(len(df), size=min(len(df), sample_rows or len(df)), replace=False))
+    for i, (cn, ser) in enumerate(df.items()):
+        row = rows[cn] = _values_memory_info(ser, sample_rows=sample_rows, rng=rng)
+        values = ser.values
+        if isinstance(values, np.ndarray) and values.dtype != object and len(values) > 0:
+            buf_key = (values.__array_interface__['data'][0], values.strides, str(values.dtype))
+            data_addrs.setdefault(buf_key, []).append(cn)
+            row['_buf_key'] = buf_key
+        if not find_dups:
+            continue
+        try:
+            hash_key = (str(ser.dtype), int(pd.util.hash_array(np.asarray(ser.iloc[sample_idxs])).sum()))
+        except TypeError:  # unhashable values
+            continue
+        for j in sample_hashes.get(hash_key, []):  # a sample hash match is only a candidate, so check
+            if row['_buf_key'] is None or row['_buf_key'] != rows[df.columns[j]]['_buf_key']:
+                # sparse or constant cols' samples often match, so compare whole-col hashes first
+                if i not in full_hashes:
+                    full_hashes[i] = _values_digest(ser)
+                if j not in full_hashes:
+                    full_hashes[j] = _values_digest(df.iloc[:, j])
+                if full_hashes[i] == full_hashes[j] and ser.equals(df.iloc[:, j]):
+                    row['dup_of'] = df.columns[j]
+                    break
+        sample_hashes.setdefault(hash_key, []).append(i)
+    for cn, row in rows.items():
+        buf_key = row.pop('_buf_key')
+        if buf_key is not None and len(data_addrs[buf_key]) > 1:
+            row['shares_with'] = ', '.join(str(other_cn) for other_cn in data_addrs[buf_key] if other_cn != cn)
+    ret = pd.DataFrame.from_dict(rows, orient='index')
+    ret.insert(3, 'deep_pct', ret['deep_bytes'] / max(ret['deep_bytes'].sum(), 1) * 100)
+    return ret
+
+def _values_digest(ser):
+    """Digest (bytes) of all of ser's values, in order"""
+    values = ser.values
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'biufcmM':
+        data = np.ascontiguousarray(values).view(np.uint8)
+    else:
+        data = pd.util.hash_array(np.asarray(values))
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _values_memory_info(values, sample_rows, rng):
+    """df_memory_info() row (OrderedDict) for a Series or Index"""
+    shallow_bytes = values.memory_usage(index=False) if isinstance(values, pd.Series) else values.memory_usage()
+    row = OrderedDict([('dtype', str(values.dtype)), ('shallow_bytes', int(shallow_bytes)),
+                       ('deep_bytes', None), ('shares_with', ''), ('dup_of', ''), ('dup_values_pct', np.nan),
+                       ('_buf_key', None)])
+    row['deep_bytes'] = row['shallow_bytes']
+    if values.dtype == object or isinstance(values.dtype, pd.StringDtype):
+        arr = values.to_numpy(dtype=object)
+        n_sample = len(arr) if sample_rows is None else min(len(arr), sample_rows)
+        if n_sample > 0:
+            sample = arr[rng.choice(len(arr), size=n_sample, replace=False)] if n_sample < len(arr) else arr
+            # objects in several sampled rows are likely shared by many more (eg interned), so are
+            # counted once, while the rest stand for len(arr) / n_sample objects each
+            id_counts = pd.Series([id(v) for v in sample]).value_counts()
+            objs = {id(v): v for v in sample}
+            sizeof = sys.getsizeof if all(type(v) in MEMORY_ATOMIC_TYPES for v in objs.values()) else deep_sizeof
+            row['deep_bytes'] += int(sum(sizeof(v) * (len(arr) / n_sample if id_counts[id_v] == 1 else 1)
+                                         for id_v, v in objs.items()))
+            try:
+                row['dup_values_pct'] = (len(objs) - len(pd.unique(sample))) / n_sample * 100
+            except TypeError:  # unhashable values
+                pass
+    elif isinstance(values.dtype, pd.CategoricalDtype):
+        row['deep_bytes'] = int(values.memory_usage(deep=True))  # categories are few, so exact is quick
+    return row
+
+def deep_sizeof(obj, seen=None, max_items=MEMORY_MAX_ITEMS, max_objs=None):
+    """
+    Return estimated bytes of obj plus everything it refers to, through containers, __dict__ and
+    __slots__, counting each object (and each numpy buffer, whatever views of it there are) once.
+    Containers of more than max_items items are estimated from max_items of them, DataFrames
+    from df_memory_info(). Classes, modules and functions it refers to are counted but not
+    followed, but if obj itself is one, its __dict__ is.
+
+    Args:
+        seen: set of ids already counted, to share across calls (it's added to)
+        max_objs: stop after following this many references (default: no limit), in which case
+            the result is only a lower bound
+    """
+    return _deep_sizeof(obj, seen=seen, max_items=max_items, max_objs=max_objs)[0]
+
+def _deep_sizeof(obj, seen, max_items, max_objs):
+    """deep_sizeof(), but returns (bytes, whether every object was visited, ie max_objs wasn't hit)"""
+    if seen is None:
+        seen = set()
+    total = 0.
+    n_objs = 0
+    complete = True
+    # (object, how many objects it's standing in for, when sampled), breadth first so that if
+    # max_objs is hit, every level down to there has been sampled
+    root = obj
+    queue = deque([(obj, 1.)])
+    while len(queue) > 0:
+        if max_objs is not None and n_objs >= max_objs:
+            return int(total), False
+        obj, weight = queue.popleft()
+        n_objs += 1  # counting repeats too, since eg small ints are in many places but the same object
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, pd.DataFrame):
+            total += weight * df_memory_info(obj, sample_rows=max_items, find_dups=False)['deep_bytes'].sum()
+            continue
+        if isinstance(obj, (pd.Series, pd.Index)):
+            values_info = _values_memory_info(obj, sample_rows=max_items, rng=np.random.default_rng(0))
+            total += weight * values_info['deep_bytes']
+            continue
+        total += weight * sys.getsizeof(obj)
+        if isinstance(obj, MEMORY_ATOMIC_TYPES) or (isinstance(obj, MEMORY_SHALLOW_TYPES) and obj is not root):
+            continue  # eg a module or class is only followed when it's what was asked about
+        if max_objs is not None and n_objs + len(queue) >= max_objs:  # what it refers to would never be reached
+            complete = False
+            continue
+        if isinstance(obj, np.ndarray):
+            base = obj
+            while isinstance(base.base, np.ndarray):
+                base = base.base
+            if base is not obj and id(base) not in seen:  # a view: count the buffer it's of, once
+                seen.add(id(base))
+                total += weight * sys.getsizeof(base)
+            if obj.dtype == object:
+                queue.extend(_sampled_items(obj.ravel(), weight, max_items))
+            continue
+        if isinstance(obj, (dict, types.MappingProxyType)):  # a class's __dict__ is a mappingproxy
+            queue.extend(_sampled_items(list(obj.keys()) + list(obj.values()), weight, max_items))
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            queue.extend(_sampled_items(obj, weight, max_items))
+        if hasattr(obj, '__dict__') and isinstance(obj.__dict__, (dict, types.MappingProxyType)):
+            queue.append((obj.__dict__, weight))
+        for slot in getattr(type(obj), '__slots__', ()):
+            if isinstance(slot, str) and hasattr(obj, slot):
+                queue.append((getattr(obj, slot), weight))
+    return int(total), complete
+
+def _sampled_items(items, weight, max_items):
+    """(item, weight) pairs of at most max_items of items, weighted up to stand for all of them"""
+    if len(items) <= max_items:
+        return [(item, weight) for item in items]
+    if not isinstance(items, (list, tuple, np.ndarray)):
+        items = list(items)
+    idxs = np.linspace(0, len(items) - 1, max_items).astype(np.intp)
+    return [(items[idx], weight * len(items) / max_items) for idx in idxs]
+
+def obj_memory_info(obj, max_items=MEMORY_MAX_ITEMS):
+    """
+    Return df breaking down deep_sizeof(obj) into its parts, biggest first: a DataFrame's cols
+    (df_memory_info()), a dict's values by key, an object's attributes, or a list/tuple/set's
+    items grouped by type. Cols:
+        type, count (of items, for groups), deep_bytes, deep_pct,
+        shared_bytes: of deep_bytes, how much is also part of an earlier (bigger) part
+    """
+    if isinstance(obj, pd.DataFrame):
+        return df_memory_info(obj, sample_rows=max_items)
+    if isinstance(obj, dict):
+        parts = [(key, [value]) for key, value in obj.items()]
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        by_type = OrderedDict()
+        for item, _ in _sampled_items(obj, 1., max_items):
+            by_type.setdefault(type(item).__name__, []).append(item)
+        parts = [('(' + type_name + ')', items) for type_name, items in by_type.items()]
+    elif hasattr(obj, '__dict__') or hasattr(type(obj), '__slots__'):
+        attrs = OrderedDict(vars(obj) if hasattr(obj, '__dict__') else {})
+        for slot in getattr(type(obj), '__slots__', ()):
+            if isinstance(slot, str) and hasattr(obj, slot):
+                attrs[slot] = getattr(obj, slot)
+        parts = list(attrs.items())
+    else:
+        parts = [('(' + type(obj).__name__ + ')', [obj])]
+    scale = max(len(obj) / max_items, 1.) if isinstance(obj, (list, tuple, set, frozenset, deque)) else 1.
+    standalone = [(part_name, items, scale * _items_deep_sizeof(items, seen=set(), max_items=max_items))
+                  for part_name, items in parts]
+    standalone.sort(key=lambda part: -part[2])
+    seen = {id(obj)}
+    rows = OrderedDict()
+    for part_name, items, deep_bytes in standalone:
+        counted = scale * _items_deep_sizeof(items, seen=seen, max_items=max_items)
+        rows[part_name] = OrderedDict([
+            ('type', type(items[0]).__name__), ('count', int(round(len(items) * scale))),
+            ('deep_bytes', int(deep_bytes)), ('shared_bytes', int(max(deep_bytes - counted, 0)))])
+    ret = pd.DataFrame.from_dict(rows, orient='index', columns=['type', 'count', 'deep_bytes', 'shared_bytes'])
+    ret.insert(3, 'deep_pct', ret['deep_bytes'] / max(ret['deep_bytes'].sum(), 1) * 100)
+    return ret
+
+def _items_deep_sizeof(items, seen, max_items):
+    return sum(deep_sizeof(item, seen=seen, max_items=max_items) for item in items)
+
+
+
+# < To shrink DataFrames' memory use > ===========================================
+
+SHRINK_CATEGORY_MAX_UNIQUE_FRAC = .5  # object cols with fewer distinct values per value than this become category
+SHRINK_SPARSE_MIN_ZEROS_FRAC = .9  # only cols with at least this fraction of zeros become sparse
+SHRINK_FLOAT32 = 'lossless'  # float64 -> float32: 'lossless' (only if no value changes) | 'always' | 'never'
+SHRINK_INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+def recommend_dtypes(df, info=None, float32=SHRINK_FLOAT32, category_max_unique_frac=SHRINK_CATEGORY_MAX_UNIQUE_FRAC,
+                     sparse_min_zeros_frac=SHRINK_SPARSE_MIN_ZEROS_FRAC):
+    """
+    Return df of the smallest dtype for each col of passed DataFrame that holds its values, one
+    row per col: dtype, recommended_dtype, reason, current_bytes (deep, see df_memory_info()),
+    expected_bytes, expected_savings_pct. Candidates are:
+        ints: the smallest int dtype that fits min and max
+        floats: float32 (see float32 arg), or if every value is a whole number, the smallest int
+            dtype, or nullable Int dtype (eg 'Int16') if there are NaNs
+        mostly (at least sparse_min_zeros_frac) zero numeric cols: sparse, with 0 not stored
+        objects: category, if nunique is under category_max_unique_frac of the non-NaN count
+    Bools, categories, datetimes etc. are kept as they are.
+
+    Args:
+        info: DFFullInfo of df, eg from df_full_info(), to use its min, max, nunique and zeros_pct
+            rather than compute them. Approximate min and max (from sampling) aren't used.
+    """
+    assert isinstance(df, pd.DataFrame)
+    assert float32 in ('lossless', 'always', 'never')
+    col_stats = _shrink_col_stats(df, info)
+    memory_info = df_memory_info(df, find_dups=False)
+    odicts_lst = []
+    for i, (cn, ser) in enumerate(df.items()):
+        stats = col_stats[i]
+        current_bytes = int(memory_info['deep_bytes'].iloc[i + 1])  # row 0 is the index
+        candidates = [(ser.dtype, current_bytes, 'keep')]
+        n = len(ser)
+        if _is_int_dtype(ser.dtype) and isinstance(ser.dtype, np.dtype) and stats['count'] > 0:
+            int_dtype = _smallest_int_dtype(stats['min'], stats['max'])
+            candidates.append((int_dtype, n * int_dtype.itemsize, 'ints fit in ' + str(int_dtype)))
+        elif _is_float_dtype(ser.dtype) and isinstance(ser.dtype, np.dtype) and stats['count'] > 0:
+            values = ser.values
+            finite = np.isfinite(stats['min']) and np.isfinite(stats['max'])
+            if finite and np.array_equal(np.floor(values), values, equal_nan=True):
+                int_dtype = _smallest_int_dtype(stats['min'], stats['max'])
+                if stats['count'] == n:
+                    candidates.append((int_dtype, n * int_dtype.itemsize, 'whole numbers fit in ' + str(int_dtype)))
+                else:
+                    nullable_dtype = pd.api.types.pandas_dtype(str(int_dtype).capitalize())
+                    candidates.append((nullable_dtype, n * (int_dtype.itemsize + 1),
+                                       'whole numbers and NaNs fit in ' + str(nullable_dtype)))
+            if ser.dtype == np.float64 and float32 != 'never' and (not finite or max(
+                    abs(stats['min']), abs(stats['max'])) <= np.finfo(np.float32).max):
+                if float32 == 'always' or np.array_equal(values.astype(np.float32), values, equal_nan=True):
+                    candidates.append((np.dtype(np.float32), n * 4, 'float32 holds ' + (
+                        'values exactly' if float32 == 'lossless' else 'values (rounded)')))
+        elif ser.dtype == object and stats['count'] > 0 and stats['unique_frac'] < category_max_unique_frac:
+            codes_itemsize = _smallest_int_dtype(-1, stats['nunique']).itemsize
+            shallow_bytes = int(memory_info['shallow_bytes'].iloc[i + 1])
+            per_value_bytes = (current_bytes - shallow_bytes) / stats['count'] + 8
+            candidates.append((pd.CategoricalDtype(), int(n * codes_itemsize + stats['nunique'] * per_value_bytes),
+                               str(stats['nunique']) + ' distinct values'))
+        if stats.get('zeros_frac', 0) >= sparse_min_zeros_frac:
+            dense_dtype, _, dense_reason = min([candidate for candidate in candidates if isinstance(candidate[0], np.dtype)],
+                                               key=lambda candidate: candidate[1])
+            if isinstance(ser.dtype, np.dtype):
+                nonzero_ct = n - int(round(stats['zeros_frac'] * stats['count']))
+                candidates.append((pd.SparseDtype(dense_dtype, fill_value=0), nonzero_ct * (dense_dtype.itemsize + 4),
+                                   '{:.0%} zeros'.format(stats['zeros_frac']) +
+                                   ('' if dense_reason == 'keep' else ', ' + dense_reason)))
+        dtype, expected_bytes, reason = min(candidates, key=lambda candidate: candidate[1])
+        odicts_lst.append(OrderedDict([
+            ('name', cn), ('dtype', ser.dtype), ('recommended_dtype', dtype), ('reason', reason),
+            ('current_bytes', current_bytes), ('expected_bytes', expected_bytes),
+            ('expected_savings_pct', (current_bytes - expected_bytes) / max(current_bytes, 1) * 100)]))
+    if len(odicts_lst) == 0:
+        return None
+    return pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys()).set_index('name')
+
+def tfrm_dtypes(df, recs, inplace=False):
+    """Return df with its cols converted to recs' recommended_dtype (recs from recommend_dtypes())"""
+    if not inplace:
+        df = df.copy()
+    for cn, rec in recs.iterrows():
+        if rec['recommended_dtype'] != rec['dtype']:
+            df[cn] = df[cn].astype(rec['recommended_dtype'])
+    return df
+
+def shrink_memory(df, info=None, inplace=False, verbose=True, **kwargs):
+    """
+    Converts df's cols to recommend_dtypes(df, info, **kwargs) and returns (shrunk df, report),
+    where report is the recommendations plus achieved_bytes and achieved_savings_pct per col
+    (and an '(all)' row of totals), from df_memory_info() of the shrunk df.
+    """
+    recs = recommend_dtypes(df, info=info, **kwargs)
+    if recs is None:
+        return df, recs
+    df = tfrm_dtypes(df, recs, inplace=inplace)
+    report = recs.copy()
+    report['achieved_bytes'] = df_memory_info(df, find_dups=False)['deep_bytes'].values[1:]
+    report['achieved_savings_pct'] = (report['current_bytes'] - report['achieved_bytes']) / \
+        report['current_bytes'].clip(lower=1) * 100
+    totals = report[['current_bytes', 'expected_bytes', 'achieved_bytes']].sum()
+    report.loc['(all)', ['current_bytes', 'expected_bytes', 'achieved_bytes']] = totals.values
+    report.loc['(all)', 'expected_savings_pct'] = (totals['current_bytes'] - totals['expected_bytes']) / max(totals['current_bytes'], 1) * 100
+    report.loc['(all)', 'achieved_savings_pct'] = (totals['current_bytes'] - totals['achieved_bytes']) / max(totals['current_bytes'], 1) * 100
+    report[['current_bytes', 'expected_bytes', 'achieved_bytes']] = \
+        report[['current_bytes', 'expected_bytes', 'achieved_bytes']].astype(np.int64)
+    if verbose:
+        print('Shrank memory from {} to {} (expected {})'.format(_readable_memory(totals['current_bytes']),
+              _readable_memory(totals['achieved_bytes']), _readable_memory(totals['expected_bytes'])))
+    return df, report
+
+def _shrink_col_stats(df, info):
+    """List of dicts (one per col) of count, min, max, zeros_frac (numeric), nunique and unique_frac (object)"""
+    tables = OrderedDict()
+    if info is not None:
+        for df_cols in (info.df_cols_float, info.df_cols_other):
+            if df_cols is not None:
+                tables.update((cn, row) for cn, row in df_cols.iterrows())
+    df_approx = None if info is None else info.df_approx
+    col_stats = []
+    for cn, ser in df.items():
+        row = tables.get(cn)
+        stats = {'count': int(ser.count())}
+        minmax_exact = df_approx is None or 'minmax_exact' not in df_approx or \
+            (cn in df_approx.index and bool(df_approx.loc[cn, 'minmax_exact']))
+        numeric = isinstance(ser.dtype, np.dtype) and ser.dtype.kind in 'iuf'
+        if numeric:
+            if row is not None and minmax_exact:
+                stats['min'], stats['max'] = row['min'], row['max']
+            elif stats['count'] > 0:
+                stats['min'], stats['max'] = np.nanmin(ser.values), np.nanmax(ser.values)
+            if row is not None and 'zeros_pct' in row and not pd.isna(row['zeros_pct']):
+                stats['zeros_frac'] = row['zeros_pct']
+            elif stats['count'] > 0:
+                stats['zeros_frac'] = np.count_nonzero(ser.values == 0) / stats['count']
+        elif ser.dtype == object:
+            if row is not None and df_approx is not None and 'nunique_est' in df_approx and cn in df_approx.index:
+                # sampled: a sample has a higher fraction of distinct values than the whole col, so
+                # judge by that (erring against category), but estimate bytes from nunique_est
+                sample_count = max(df_approx.loc[cn, 'sample_rows'] * row['filled_pct'], 1)
+                stats['unique_frac'] = row['nunique'] / sample_count
+                stats['nunique'] = int(df_approx.loc[cn, 'nunique_est'])
+            else:
+                if row is not None and 'nunique' in row:
+                    stats['nunique'] = int(row['nunique'])
+                else:
+                    try:
+                        stats['nunique'] = ser.nunique()
+                    except TypeError:  # unhashable values, so no category
+                        stats['nunique'] = stats['count']
+                stats['unique_frac'] = stats['nunique'] / max(stats['count'], 1)
+        col_stats.append(stats)
+    return col_stats
+
+def _smallest_int_dtype(min_val, max_val):
+    for int_dtype in SHRINK_INT_DTYPES:
+        if np.iinfo(int_dtype).min <= min_val and max_val <= np.iinfo(int_dtype).max:
+            return np.dtype(int_dtype)
+    return np.dtype(np.float64)  # too big for any int
+
+
+
+# < To find outliers > ===========================================
+
+OUTLIER_MEDADS = 5  # values more than this many medADs from their col's median are outliers
+
+def outlier_counts(df, n_medADs=OUTLIER_MEDADS, info=None):
+    """Return MedADOutliers(n_medADs).fit(df, info).counts(df): df of outliers per float col"""
+    return MedADOutliers(n_medADs=n_medADs).fit(df, info=info).counts(df)
+
+def tfrm_clip_outliers(df, n_medADs=OUTLIER_MEDADS, info=None, inplace=False):
+    """Return df with float cols' outliers clipped to n_medADs medADs from the median (winsorized)"""
+    return MedADOutliers(n_medADs=n_medADs).fit(df, info=info).transform(df, inplace=inplace)
+
+def outlier_counts_chunked(make_chunks, n_medADs=OUTLIER_MEDADS, info=None):
+    """
+    Like outlier_counts(), for data too big for memory. Unless info (eg from df_full_info_file())
+    is passed, it's two streaming passes: the first learns (approximate) medians and medADs, the
+    second counts.
+
+    Args:
+        make_chunks: fn that returns a new iterable of DataFrames (eg lambda:
+            pd.read_csv(path, chunksize=1000000)), called once per pass
+    """
+    outliers = _fit_chunked(make_chunks, n_medADs, info)
+    total = None
+    for chunk in make_chunks():
+        counts = outliers.counts(chunk)[['count', 'outlier_ct', 'low_ct', 'high_ct']]
+        total = counts if total is None else total.add(counts, fill_value=0)
+    ret = outliers.bounds_.join(total.astype(np.int64))
+    ret.insert(len(ret.columns), 'outlier_pct', ret['outlier_ct'] / ret['count'].clip(lower=1))
+    return ret
+
+def tfrm_clip_outliers_chunked(make_chunks, n_medADs=OUTLIER_MEDADS, info=None, inplace=False):
+    """
+    Like tfrm_clip_outliers(), for data too big for memory, see outlier_counts_chunked(). Yields
+    chunks, clipped in place if inplace (saves memory when make_chunks reads new chunks each pass).
+    """
+    outliers = _fit_chunked(make_chunks, n_medADs, info)
+    for chunk in make_chunks():
+        yield outliers.transform(chunk, inplace=inplace)
+
+def _fit_chunked(make_chunks, n_medADs, info):
+    outliers = MedADOutliers(n_medADs=n_medADs)
+    if info is not None:
+        return outliers.fit(None, info=info)
+    for chunk in make_chunks():
+        outliers.partial_fit(chunk)
+    return outliers
+
+
+class MedADOutliers():
+    """
+    Robust outliers of float cols: values more than n_medADs medADs (median absolute deviations)
+    from their col's median, the same measure as cols_info_float()'s min_medADs and max_medADs.
+
+    fit() gets each col's median and medAD from float_block_info() of the whole float block, or
+    takes them from info (a DFFullInfo of the same df, eg a cached one) for the cols it has.
+    partial_fit() instead folds chunks into a DFInfoAccumulator, so they're approximate for big
+    data (see df_full_info_chunks()). Either way they're in .bounds_, a df indexed by col name of
+    median, medAD, lower and upper. Then mask(), counts() and transform() (which clips to the
+    bounds, ie winsorizes) work on any df with those cols, vectorized a batch of cols at a time.
+    Cols whose medAD is 0 or NaN have no outliers.
+    """
+
+    def __init__(self, n_medADs=OUTLIER_MEDADS):
+        self.n_medADs = n_medADs
+        self.bounds_ = None
+        self._accumulator = None
+
+    def fit(self, df, info=None, n_jobs=1, executor='thread'):
+        """
+        Learns each float col's median and medAD, returns self. With info, df can be None to use
+        just info's cols.
+        """
+        medians = OrderedDict()
+        if info is not None and info.df_cols_float is not None and 'medAD' in info.df_cols_float:
+            for cn, row in info.df_cols_float.iterrows():
+                medians[cn] = (row['median'], row['medAD'])
+        if df is not None:
+            cns = [cn for cn in df.select_dtypes(['float']).columns if cn not in medians]
+            if len(cns) > 0:
+                block_info = float_block_info(df[cns].values, n_jobs=n_jobs, executor=executor)
+                medians.update(zip(cns, zip(block_info['median'], block_info['medAD'])))
+        self._set_bounds(medians)
+        return self
+
+    def partial_fit(self, df):
+        """Folds a chunk of rows into approximate medians and medADs, returns self"""
+        if self._accumulator is None:
+            self._accumulator = DFInfoAccumulator()
+        self._accumulator.update(df.select_dtypes(['float']))
+        df_cols_float = self._accumulator._tables()['df_cols_float']
+        medians = OrderedDict()
+        if df_cols_float is not None:
+            medians.update(zip(df_cols_float.index, zip(df_cols_float['median'], df_cols_float['medAD'])))
+        self._set_bounds(medians)
+        return self
+
+    def mask(self, df):
+        """Returns bool df (fit() cols that df has) of which values are outliers"""
+        masks = [(values < lower) | (values > upper) for values, lower, upper in self._batches(df)]
+        cns = self._cns(df)
+        return pd.DataFrame(np.hstack(masks) if len(masks) > 0 else np.empty((len(df), 0), dtype=bool),
+                            index=df.index, columns=cns)
+
+    def counts(self, df):
+        """
+        Returns df of outliers per col (fit() cols that df has): median, medAD, lower, upper,
+        count (non-NaN values), outlier_ct, low_ct, high_ct, outlier_pct
+        """
+        count, low_ct, high_ct = [], [], []
+        for values, lower, upper in self._batches(df):
+            count.append(np.count_nonzero(~np.isnan(values), axis=0))
+            low_ct.append(np.count_nonzero(values < lower, axis=0))
+            high_ct.append(np.count_nonzero(values > upper, axis=0))
+        ret = self.bounds_.loc[self._cns(df)].copy()
+        for key, lst in (('count', count), ('low_ct', low_ct), ('high_ct', high_ct)):
+            ret[key] = np.concatenate(lst) if len(lst) > 0 else np.empty(0, dtype=np.int64)
+        ret.insert(len(ret.columns) - 2, 'outlier_ct', ret['low_ct'] + ret['high_ct'])
+        ret['outlier_pct'] = ret['outlier_ct'] / ret['count'].clip(lower=1)
+        return ret
+
+    def transform(self, df, inplace=False):
+        """
+        Returns df with outliers clipped to lower and upper, keeping dtypes. If inplace, clips df
+        itself (in place, without allocating), otherwise one copy of df.
+        """
+        if self.bounds_ is None:
+            raise ValueError('MedADOutliers must be fit() before it can transform()')
+        if not inplace:
+            df = df.copy()
+        for cn in self._cns(df):
+            lower, upper = self.bounds_.at[cn, 'lower'], self.bounds_.at[cn, 'upper']
+            if np.isnan(lower):
+                continue
+            values = df[cn].values  # a view of df's data, so clipping it clips df
+            lower, upper = _round_inward(lower, upper, values.dtype)
+            if values.flags.writeable:
+                np.clip(values, lower, upper, out=values)
+            else:
+                df[cn] = np.clip(values, lower, upper).astype(values.dtype)
+        return df
+
+    def fit_transform(self, df, inplace=False):
+        return self.fit(df).transform(df, inplace=inplace)
+
+    def _set_bounds(self, medians):
+        """Sets bounds_ from dict of col name -> (median, medAD)"""
+        median = np.array([median for median, _ in medians.values()], dtype=np.float64)
+        med_AD = np.array([med_AD for _, med_AD in medians.values()], dtype=np.float64)
+        has_spread = med_AD > 0
+        self.bounds_ = pd.DataFrame(OrderedDict([
+            ('median', median), ('medAD', med_AD),
+            ('lower', np.where(has_spread, median - self.n_medADs * med_AD, np.nan)),
+            ('upper', np.where(has_spread, median + self.n_medADs * med_AD, np.nan))]),
+            index=pd.Index(list(medians), name='name', tupleize_cols=False))
+
+    def _cns(self, df):
+        if self.bounds_ is None:
+            raise ValueError('MedADOutliers must be fit() first')
+        return [cn for cn in self.bounds_.index if cn in df.columns]
+
+    def _batches(self, df):
+        """Yields (2D float values, lower, upper) of batches of _cns(df) of at most FLOAT_BATCH_MAX_CELLS"""
+        cns = self._cns(df)
+        batch_ncols = max(1, FLOAT_BATCH_MAX_CELLS // max(len(df), 1))
+        for i in range(0, len(cns), batch_ncols):
+            batch_cns = cns[i:i + batch_ncols]
+            bounds = self.bounds_.loc[batch_cns]
+            # NaN bounds (no spread) compare False, so those cols have no outliers
+            yield df[batch_cns].values.astype(np.float64, copy=False), bounds['lower'].values, bounds['upper'].values
+
+def _round_inward(lower, upper, dtype):
+    """lower and upper as dtype (eg float32), rounded towards each other so clipped values are within them"""
+    lower_cast, upper_cast = dtype.type(lower), dtype.type(upper)
+    if lower_cast < lower:
+        lower_cast = np.nextafter(lower_cast, dtype.type(np.inf))
+    if upper_cast > upper:
+        upper_cast = np.nextafter(upper_cast, dtype.type(-np.inf))
+    return lower_cast, upper_cast
 
 
 
 # < To get info about objects in general > ===========================================
 
+WIT_SAMPLE_ROWS = 100000  # wit() profiles a sample of this many rows of bigger DataFrames, to stay quick
+WIT_MEMORY_MAX_ITEMS = 100  # wit_str() estimates memory from this many items per container...
+WIT_MEMORY_MAX_OBJS = 10000  # ...and follows at most this many references, so it stays quick
+BOUNDED_STR_MAX_SECS = .1  # bounded_str() stops going into containers after this long
+BOUNDED_STR_MAX_DEPTH = 4  # bounded_str() shows containers nested this deep, deeper ones as '...'
+
+def bounded_str(obj, max_len=1000, max_secs=BOUNDED_STR_MAX_SECS, max_depth=BOUNDED_STR_MAX_DEPTH):
+    """
+    Returns str(obj)[:max_len], but for containers, numpy arrays and pandas objects without making
+    the whole str first: only as many items as could fit in max_len get formatted (plus '...'), and
+    nested containers only to max_depth, so it costs about the same however big obj is. Other
+    objects' own str() is used as is, since there's no way to tell it to stop early.
+    """
+    if isinstance(obj, str):
+        return obj[:max_len]
+    if isinstance(obj, (list, tuple, set, frozenset, dict, deque, np.ndarray, pd.DataFrame,
+                        pd.Series, pd.Index)):
+        return _BoundedRepr(max_len=max_len, max_secs=max_secs, max_depth=max_depth).repr(obj)[:max_len]
+    return str(obj)[:max_len]
+
+
+class _BoundedRepr(reprlib.Repr):
+    """reprlib.Repr with limits based on the output size, a time budget, and numpy/pandas fast paths"""
+
+    def __init__(self, max_len, max_secs, max_depth):
+        super().__init__()
+        self.maxlevel = max_depth
+        self.maxtuple = self.maxlist = self.maxarray = self.maxdeque = max(1, max_len // 2)
+        self.maxdict = self.maxset = self.maxfrozenset = max(1, max_len // 4)
+        self.maxstring = self.maxother = self.maxlong = max(20, max_len)
+        self._max_len = max_len
+        self._deadline = time.perf_counter() + max_secs
+
+    def repr1(self, x, level):
+        if time.perf_counter() > self._deadline:
+            return '...'
+        n_rows = max(2, min(self._max_len // 20, 60))  # rows that could fit
+        if isinstance(x, np.ndarray):
+            with np.printoptions(threshold=max(6, self._max_len // 4), edgeitems=3):
+                return repr(x)
+        if isinstance(x, pd.DataFrame):
+            # to_string() of just the head and tail rows/cols: over max_rows/max_cols by one, so it
+            # still shows the '...', without pandas looking at every row to lay out the rest
+            n_cols = max(2, min(self._max_len // 10, 20))
+            return x.iloc[_head_tail_idxs(len(x), n_rows), _head_tail_idxs(x.shape[1], n_cols)].to_string(max_rows=n_rows, max_cols=n_cols) + \
+                   '\n\n[{} rows x {} columns]'.format(*x.shape)
+        if isinstance(x, pd.Series):
+            return x.iloc[_head_tail_idxs(len(x), n_rows)].to_string(max_rows=n_rows) + \
+                   '\nLength: {}, dtype: {}'.format(len(x), x.dtype)
+        if isinstance(x, pd.Index) and len(x) > n_rows:
+            return '{}([{}, ..., {}], dtype={!r}, length={})'.format(
+                type(x).__name__, ', '.join(self.repr1(v, level - 1) for v in x[:n_rows // 2]),
+                ', '.join(self.repr1(v, level - 1) for v in x[-(n_rows // 2):]), str(x.dtype), len(x))
+        return super().repr1(x, level)
+
+def _head_tail_idxs(n, n_shown):
+    """Positions of the first and last n_shown // 2 (+1 so that it's over n_shown) of n items"""
+    if n <= n_shown + 1:
+        return np.arange(n)
+    return np.r_[:n_shown // 2 + 1, n - n_shown // 2:n]
+
 def wit_str(obj, name=''):
     """
     Returns string of info about object, including len() and type().
@@ -373,14 +2494,20 @@ def wit_str(obj, name=''):
     except TypeError:
         ret += 'N/A'
 
-    ret += '\n' + str(obj)[:kMaxStrLen]
+    ret += '\n' + bounded_str(obj, max_len=kMaxStrLen)
     ret += '\n\ntype: ' + str(type(obj))
+    memory_bytes, complete = _deep_sizeof(obj, seen=None, max_items=WIT_MEMORY_MAX_ITEMS, max_objs=WIT_MEMORY_MAX_OBJS)
+    ret += ' | memory: ' + ('' if complete else 'over ') + _readable_memory(memory_bytes)
+    ret += ' deep, est. (see obj_memory_info())'
     ret += ' | docstring:\n"""' + str(obj.__doc__)[:kMaxDocstringLen]
     return ret
 
-def wit(obj, name=''):
-    """Prints string of info about object, including len() and type()."""
+def wit(obj, name='', sample_rows=WIT_SAMPLE_ROWS):
+    """
+    Prints string of info about object, including len() and type().
+    For a DataFrame, it's df_full_info() of at most sample_rows rows (None for all rows).
+    """
     if IPYTHON_RUNNING and isinstance(obj, pd.DataFrame):
-        return df_full_info(df=obj, name=name)
+        return df_full_info(df=obj, name=name, sample_rows=sample_rows, exact_minmax=False)
     else:
         print(wit_str(obj=obj, name=name))
@@ -9,10 +9,14 @@ For how to import, see defnotdatatools/README.md.
 
 import os
 import sys
+from collections.abc import Sequence
 
 
 # < Constants > ===============================================================
 
+KEY_PATH_SEP = '.'  # between keys in KeyInventory's paths, eg "user.address.city"
+KEY_PATH_LIST = '[]'  # marks going into a list's dicts in KeyInventory's paths, eg "items[].sku"
+
 
 
 # < File system related > ===============================================================
@@ -51,15 +55,137 @@ def sod_keys_within(sod, within=None):
     For a sod (Sequence of Dicts), returns sorted set list of keys from dicts 
     at a given key ("within"), or if within is None then it's the root keys.
 
-    Note: the "within" has no way of going more than 1 level deep currently.
+    within can also be a list of keys, to go more than 1 level deep (eg ['user', 'address']).
+    For a big or streamed sod, or to see keys at every depth at once, see KeyInventory.
     """
     assert isinstance(sod, Sequence)
+    if within is not None and not isinstance(within, (list, tuple)):
+        within = [within]
     keys = set()
     for d in sod:
         assert isinstance(d, dict)
-        if within is None:
-            keys = keys.union(d.keys())
-        else:
-            assert isinstance(d[within], dict)
-            keys = keys.union(d[within].keys())
+        for key in within or []:
+            d = d[key]
+            assert isinstance(d, dict)
+        keys.update(d.keys())
     return sorted(list(keys))
+
+def jsonl_key_inventory(source, n_jobs=1, max_depth=None):
+    """
+    Returns KeyInventory of all the records in source, which is a JSON Lines file path, or an
+    iterable of records (dicts) or JSON lines. Reads one line at a time, so memory stays constant.
+
+    Args:
+        n_jobs: for a file path, number of processes to scan it with, each scanning its own byte
+            range of the file into a KeyInventory, then all merged
+        max_depth: don't go deeper than this many keys (None to go all the way down)
+    """
+    import json  # here and below rather than at the top, so importing misc stays quick
+    if not isinstance(source, str):
+        inventory = KeyInventory(max_depth=max_depth)
+        for record in source:
+            inventory.update(json.loads(record) if isinstance(record, (str, bytes)) else record)
+        return inventory
+    validate_path(source)
+    if n_jobs is None or n_jobs < 2:
+        return _jsonl_range_key_inventory(source, 0, None, max_depth)
+    size = os.path.getsize(source)
+    bounds = [size * i // n_jobs for i in range(n_jobs + 1)]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        inventories = list(pool.map(_jsonl_range_key_inventory, [source] * n_jobs, bounds[:-1],
+                                    bounds[1:], [max_depth] * n_jobs))
+    inventory = inventories[0]
+    for other in inventories[1:]:
+        inventory.merge(other)
+    return inventory
+
+def _jsonl_range_key_inventory(path, start, end, max_depth):
+    """KeyInventory of lines of a JSON Lines file that start in byte range [start, end) (end None for EOF)"""
+    import json
+    inventory = KeyInventory(max_depth=max_depth)
+    with open(path, 'rb') as f:
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()  # the line in progress at start belongs to the previous range
+        while end is None or f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                inventory.update(json.loads(line))
+    return inventory
+
+
+class KeyInventory():
+    """
+    Inventory of the keys in a stream of records (dicts), at every depth: for each key path (eg
+    "user.address.city", or "items[].sku" for dicts in a list), how many times it appeared and
+    the types (by name, eg 'str', 'NoneType') of its values. update() takes one record at a time,
+    so memory depends on the number of distinct paths, not records, and merge() combines
+    inventories of separate parts of a stream.
+    """
+
+    def __init__(self, max_depth=None):
+        self.max_depth = max_depth
+        self.n_records = 0
+        self.counts = {}  # path -> number of times seen
+        self.types = {}  # path -> {type name -> number of times seen}
+
+    def update(self, record):
+        """Adds a record's keys to the inventory"""
+        assert isinstance(record, dict)
+        self.n_records += 1
+        self._add_keys(record, '', 1)
+
+    def merge(self, other):
+        """Adds another KeyInventory's keys to this one"""
+        assert isinstance(other, KeyInventory)
+        self.n_records += other.n_records
+        for path, count in other.counts.items():
+            self.counts[path] = self.counts.get(path, 0) + count
+            path_types = self.types.setdefault(path, {})
+            for type_name, type_count in other.types[path].items():
+                path_types[type_name] = path_types.get(type_name, 0) + type_count
+
+    def keys(self, within=None):
+        """
+        Returns sorted list of the keys directly within path within (eg "user.address"), or of
+        the root keys if within is None, like sod_keys_within() does. Where a key's value is a
+        list of dicts, its dicts' keys are within it, eg keys('items') gives those of "items[]".
+        """
+        prefix = '' if within is None else _without_list_marks(within + KEY_PATH_SEP)
+        keys = set()
+        for path in self.counts:
+            path = _without_list_marks(path)
+            if path.startswith(prefix):
+                keys.add(path[len(prefix):].split(KEY_PATH_SEP)[0])
+        return sorted(keys)
+
+    def paths(self):
+        """Returns sorted list of (path, count, {type name: count}), one per path"""
+        return [(path, self.counts[path], dict(self.types[path])) for path in sorted(self.counts)]
+
+    def _add_keys(self, d, prefix, depth):
+        counts = self.counts
+        types = self.types
+        for key, val in d.items():
+            path = prefix + str(key)
+            counts[path] = counts.get(path, 0) + 1
+            path_types = types.get(path)
+            if path_types is None:
+                path_types = types[path] = {}
+            type_name = type(val).__name__
+            path_types[type_name] = path_types.get(type_name, 0) + 1
+            if self.max_depth is not None and depth >= self.max_depth:
+                continue
+            if isinstance(val, dict):
+                self._add_keys(val, path + KEY_PATH_SEP, depth + 1)
+            elif isinstance(val, list):
+                for item in val:
+                    if isinstance(item, dict):
+                        self._add_keys(item, path + KEY_PATH_LIST + KEY_PATH_SEP, depth + 1)
+
+def _without_list_marks(path):
+    """path with KeyInventory's list marks taken out, eg "items[].sku" -> "items.sku" """
+    return path.replace(KEY_PATH_LIST + KEY_PATH_SEP, KEY_PATH_SEP)
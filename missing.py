@@ -8,7 +8,13 @@ For how to import, see defnotdatatools/README.md.
 
 # < Setup > ============================================================================
 
+import warnings
+from collections import OrderedDict
+
 import numpy as np
+import pandas as pd
+
+from . import sketch
 
 
 
@@ -27,3 +33,428 @@ def tfrm_fill_median(series, fill_val_if_no_median_possible=0):
     if series.count() == 0:  # if ENTIRE series is all NaN...
         return series.fillna(fill_val_if_no_median_possible)
     return series.fillna(series.median())
+
+def tfrm_fill_median_df(df, fill_val_if_no_median_possible=0, inplace=False):
+    """
+    Same as df.apply(tfrm_fill_median), but much faster for wide DataFrames: all the medians
+    come from np.nanmedian over the float-like cols at once, see MedianFiller.
+    """
+    return MedianFiller(fill_val_if_no_median_possible=fill_val_if_no_median_possible).fit(df).transform(
+        df, inplace=inplace)
+
+def tfrm_fill_median_by_group(df, by, fill_val_if_no_median_possible=0, inplace=False):
+    """
+    Fill NaN's in float-like cols with the median of their group (rows with the same values of
+    the by col or cols), see GroupMedianFiller.
+    """
+    filler = GroupMedianFiller(by=by, fill_val_if_no_median_possible=fill_val_if_no_median_possible)
+    return filler.fit(df).transform(df, inplace=inplace)
+
+def tfrm_fill_median_by_group_chunked(make_chunks, by, fill_val_if_no_median_possible=0, inplace=False):
+    """
+    Like tfrm_fill_median_by_group(), for data too big for memory, in two streaming passes: the
+    first learns (approximate) group medians from samples, the second yields filled chunks.
+
+    Args:
+        make_chunks: fn that returns a new iterable of DataFrames (eg lambda:
+            pd.read_csv(path, chunksize=1000000)), called once per pass
+        inplace: fill each chunk itself rather than a copy, which saves memory when make_chunks
+            makes new chunks each pass (eg reads them), but changes chunks it holds on to
+    """
+    filler = GroupMedianFiller(by=by, fill_val_if_no_median_possible=fill_val_if_no_median_possible)
+    for chunk in make_chunks():
+        filler.partial_fit(chunk)
+    for chunk in make_chunks():
+        yield filler.transform(chunk, inplace=inplace)
+
+
+
+# < tfrm classes > ============================================================================
+
+class MedianFiller:
+
+    """
+    Fills NaN's in float-like cols with their medians, like tfrm_fill_median() does to each col,
+    but learns (fit()s) the medians once, so they can then be used to transform() other
+    DataFrames, eg scoring batches, without computing them again. Medians are in .medians_, a
+    Series indexed by col name, with fill_val_if_no_median_possible for cols that were all NaN.
+    """
+
+    BATCH_MAX_CELLS = 2 ** 24  # fit() does the float cols in batches of at most this many cells
+
+    def __init__(self, fill_val_if_no_median_possible=0):
+        self.fill_val_if_no_median_possible = fill_val_if_no_median_possible
+        self.medians_ = None
+
+    def fit(self, df):
+        """Learns the median of each float-like col of df, returns self"""
+        poss = [i for i, dtype in enumerate(df.dtypes) if _is_float_like(dtype)]  # by position, as names may repeat
+        batch_ncols = max(1, MedianFiller.BATCH_MAX_CELLS // max(len(df), 1))
+        medians_lst = []
+        for i in range(0, len(poss), batch_ncols):
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN cols, handled below
+                medians_lst.append(np.nanmedian(df.iloc[:, poss[i:i + batch_ncols]].values, axis=0))
+        medians = np.concatenate(medians_lst) if len(medians_lst) > 0 else np.empty(0)
+        self.medians_ = pd.Series(medians, index=df.columns[poss]).fillna(self.fill_val_if_no_median_possible)
+        return self
+
+    def transform(self, df, inplace=False):
+        """
+        Returns df with NaN's in the fit() cols filled with their medians. If inplace, fills df
+        itself (without allocating anything but a NaN mask per col), otherwise fills one copy of df.
+        """
+        if self.medians_ is None:
+            raise ValueError('MedianFiller must be fit() before it can transform()')
+        if not inplace:
+            df = df.copy()
+        medians_by_cn = OrderedDict()  # a col name repeated in df gets the medians of its fit() cols in turn
+        for cn, median in self.medians_.items():
+            medians_by_cn.setdefault(cn, []).append(median)
+        n_seen = {}
+        for i, cn in enumerate(df.columns):
+            if cn not in medians_by_cn:
+                continue
+            k = n_seen[cn] = n_seen.get(cn, -1) + 1
+            if k >= len(medians_by_cn[cn]):
+                continue
+            values = df.iloc[:, i].values  # a view of df's data, so filling it fills df
+            isnull = np.isnan(values)
+            if isnull.any():
+                values[isnull] = medians_by_cn[cn][k]
+        return df
+
+    def fit_transform(self, df, inplace=False):
+        return self.fit(df).transform(df, inplace=inplace)
+
+class GroupMedianFiller:
+
+    """
+    Fills NaN's in float-like cols with the median of their group, ie of the rows with the same
+    values in the by col (or list of cols). Where a group's col is all NaN, fills with
+    fill_val_if_no_median_possible, as tfrm_fill_median() on that group would. Rows of a group not
+    seen when fitting (or with a NaN key) get the col's overall median instead.
+
+    fit() gets exact medians, all groups and cols at once from one groupby (the keys are
+    factorized just once). partial_fit() instead folds chunks, for data too big for memory, into a
+    uniform sample (reservoir) of at most SAMPLE_SIZE values per group and col, kept for all groups
+    in one array per col and updated for all of them at once. Its medians are exact for groups
+    with at most SAMPLE_SIZE values, and approximate (rank error ~1.6%) for bigger ones. Medians
+    are in .medians_ (indexed by group) and .col_medians_.
+    """
+
+    SAMPLE_SIZE = 1000  # partial_fit() keeps at most this many values per group and col
+
+    def __init__(self, by, fill_val_if_no_median_possible=0, seed=None):
+        self.by = by
+        self.fill_val_if_no_median_possible = fill_val_if_no_median_possible
+        self.medians_ = None
+        self.col_medians_ = None
+        self._keys = None  # pd.Index of group keys seen by partial_fit(), a group's code is its position
+        self._samples = None  # col name -> (group codes, values, number of values seen per group)
+        self._col_sketches = None  # col name -> sketch.QuantileSketch, for col medians
+        self._rng = np.random.default_rng(seed)
+
+    def fit(self, df):
+        """Learns the exact median of each float-like col in each group of df, returns self"""
+        cns = self._float_cns(df)
+        self.medians_ = df.groupby(self.by)[cns].median()
+        self.col_medians_ = MedianFiller(self.fill_val_if_no_median_possible).fit(df[cns]).medians_
+        self._keys = self._samples = self._col_sketches = None
+        return self
+
+    def partial_fit(self, df):
+        """Folds a chunk of rows into approximate group medians, returns self"""
+        if self._samples is None:
+            self._samples, self._col_sketches = OrderedDict(), OrderedDict()
+        by = self.by if isinstance(self.by, list) else [self.by]
+        has_key = df[by].notna().all(axis=1).values  # like groupby(), rows with NaN keys aren't in any group
+        codes = self._group_codes(df.loc[has_key, by])
+        for cn in self._float_cns(df):
+            self._col_sketches.setdefault(cn, sketch.QuantileSketch()).update(df[cn].values)
+            values = df[cn].values[has_key]
+            present = ~np.isnan(values)
+            self._update_sample(cn, codes[present], values[present])
+        self.medians_ = None  # to be made from the samples by transform()
+        return self
+
+    def transform(self, df, inplace=False):
+        """Returns df with NaN's in the fit cols filled, in df itself if inplace, else in a copy"""
+        if self.medians_ is None and self._samples is not None:
+            self._medians_from_samples()
+        if self.medians_ is None:
+            raise ValueError('GroupMedianFiller must be fit() before it can transform()')
+        if not inplace:
+            df = df.copy()
+        by = self.by if isinstance(self.by, list) else [self.by]
+        if len(by) == 1:
+            keys = pd.Index(df[by[0]])
+        else:
+            keys = pd.MultiIndex.from_frame(df[by])
+        group_idxs = self.medians_.index.get_indexer(keys)  # -1 for groups not seen when fitting
+        for cn, col_median in self.col_medians_.items():
+            if cn not in df.columns:
+                continue
+            values = df[cn].values  # a view of df's data, so filling it fills df
+            isnull = np.isnan(values)
+            if not isnull.any():
+                continue
+            null_group_idxs = group_idxs[isnull]
+            fill_vals = self.medians_[cn].values[null_group_idxs]
+            fill_vals[np.isnan(fill_vals)] = self.fill_val_if_no_median_possible
+            fill_vals[null_group_idxs < 0] = col_median
+            values[isnull] = fill_vals
+        return df
+
+    def _float_cns(self, df):
+        by = self.by if isinstance(self.by, list) else [self.by]
+        return [cn for cn, dtype in df.dtypes.items() if _is_float_like(dtype) and cn not in by]
+
+    def _group_codes(self, key_df):
+        """Codes (positions in self._keys) of key_df's rows' groups, adding new groups to self._keys"""
+        if len(key_df.columns) == 1:
+            chunk_codes, uniques = pd.factorize(key_df.iloc[:, 0])
+            uniques = pd.Index(uniques, name=key_df.columns[0])
+        else:
+            chunk_codes, uniques = pd.MultiIndex.from_frame(key_df).factorize()
+        if self._keys is None:
+            self._keys = uniques[:0]
+        idxs = self._keys.get_indexer(uniques)
+        is_new = idxs < 0
+        idxs[is_new] = len(self._keys) + np.arange(np.count_nonzero(is_new))
+        self._keys = self._keys.append(uniques[is_new])
+        self._keys.names = list(key_df.columns)
+        return idxs[chunk_codes]
+
+    def _update_sample(self, cn, new_codes, new_values):
+        """Folds a chunk's non-NaN values of col cn (and their group codes) into its sample"""
+        n_groups = len(self._keys)
+        old_codes, old_values, n_seen = self._samples.get(
+            cn, (np.empty(0, dtype=np.intp), np.empty(0), np.empty(0, dtype=np.int64)))
+        n_seen = np.concatenate([n_seen, np.zeros(n_groups - len(n_seen), dtype=np.int64)])
+        n_kept = np.bincount(old_codes, minlength=n_groups)
+        n_new = np.bincount(new_codes, minlength=n_groups)
+        codes = np.concatenate([old_codes, new_codes])
+        values = np.concatenate([old_values, new_values])
+        over = n_kept + n_new > self.SAMPLE_SIZE
+        if over.any():
+            # For a uniform sample of all of a group's values so far, the number of them that are
+            # new is hypergeometric. Those are picked at random from the new values and the rest
+            # from the old sample (itself uniform), all groups at once: shuffle, stable sort by (group,
+            # new or old), then keep the first so many of each run
+            take_new = n_new.copy()
+            take_new[over] = self._rng.hypergeometric(n_new[over], n_seen[over], self.SAMPLE_SIZE)
+            take_old = np.where(over, self.SAMPLE_SIZE - take_new, n_kept)
+            is_new = np.concatenate([np.zeros(len(old_codes), dtype=bool), np.ones(len(new_codes), dtype=bool)])
+            order = self._rng.permutation(len(codes))
+            order = order[np.argsort(codes[order] * 2 + is_new[order], kind='stable')]
+            codes, values, is_new = codes[order], values[order], is_new[order]
+            is_run_start = np.concatenate([[True], (codes[1:] != codes[:-1]) | (is_new[1:] != is_new[:-1])])
+            run_starts = np.flatnonzero(is_run_start)
+            rank_in_run = np.arange(len(codes)) - run_starts[np.cumsum(is_run_start) - 1]
+            keep = rank_in_run < np.where(is_new, take_new[codes], take_old[codes])
+            codes, values = codes[keep], values[keep]
+        self._samples[cn] = (codes, values, n_seen + n_new)
+
+    def _medians_from_samples(self):
+        """Sets medians_ and col_medians_ from partial_fit()'s samples, one groupby median per col"""
+        n_groups = len(self._keys)
+        medians = OrderedDict()
+        for cn, (codes, values, _) in self._samples.items():
+            medians[cn] = pd.Series(values).groupby(codes).median().reindex(np.arange(n_groups)).values
+        self.medians_ = pd.DataFrame(medians, index=self._keys, columns=list(self._samples))
+        col_medians = pd.Series([col_sketch.quantile(.5) for col_sketch in self._col_sketches.values()],
+                                index=list(self._col_sketches), dtype=np.float64)
+        self.col_medians_ = col_medians.fillna(self.fill_val_if_no_median_possible)
+
+def _is_float_like(dtype):
+    return isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.inexact)
+
+
+
+# < Missingness patterns > ============================================================================
+
+def analyze_missingness(df_or_chunks):
+    """
+    Returns MissingnessAnalyzer of a DataFrame, or of an iterable of DataFrames (eg
+    pd.read_csv(path, chunksize=1000000)).
+    """
+    analyzer = MissingnessAnalyzer()
+    for chunk in [df_or_chunks] if isinstance(df_or_chunks, pd.DataFrame) else df_or_chunks:
+        analyzer.update(chunk)
+    return analyzer
+
+def row_miss_cts(df):
+    """Same as df.isna().sum(axis=1), from popcounts of each row's NaN mask packed into bits"""
+    row_bits = np.packbits(df.isna().values, axis=1)
+    return pd.Series(_popcount_sum(row_bits), index=df.index)
+
+class MissingnessAnalyzer:
+
+    """
+    How data is missing, learned chunk by chunk (update()) with memory bounded by the number of
+    cols rather than rows, so that it's clear which fill is safe before doing one. Eg if two cols
+    are mostly missing together (comissing_df()), or a few patterns of missing cols account for
+    most rows (top_patterns()), filling each col on its own with its median (tfrm_fill_median())
+    makes rows that never occurred.
+
+    Rows are done in blocks of at most BATCH_MAX_CELLS cells. Each row's NaN mask is packed into
+    bits, which are popcounted for its number of NaNs, and grouped by (np.unique()) into the
+    block's distinct patterns. Pairwise co-missingness counts come straight from the NaN mask,
+    however many patterns there are: when NaNs are sparse, by counting each row's pairs of NaN
+    cols (np.bincount()), else by one matrix product over the cols with NaNs. Patterns are
+    counted in a sketch.HeavyHitters of max_patterns (each block is Misra-Gries trimmed to
+    max_patterns first, so memory doesn't grow with its distinct patterns), so top_patterns()
+    is exact until there are more distinct patterns.
+    """
+
+    BATCH_MAX_CELLS = 2 ** 24  # update() does blocks of rows of at most this many cells
+    PAIRS_BATCH = 2 ** 22  # _comissing_counts() counts at most this many NaN pairs at a time
+    PAIRS_VS_MATMUL = 64  # counts NaN pairs rather than a matrix product if there are this many times fewer
+
+    def __init__(self, max_patterns=sketch.HEAVY_HITTERS_CAPACITY):
+        self.columns = None
+        self.nrows = 0
+        self._comissing = None  # counts of rows where both cols are NaN
+        self._row_miss_ct_counts = None  # number of rows with each number of NaNs
+        self._patterns = sketch.HeavyHitters(capacity=max_patterns)  # packed row masks' bytes -> count
+
+    def update(self, df):
+        """Folds a chunk of rows into the counts, returns self"""
+        if self.columns is None:
+            self._reset(list(df.columns))
+        elif list(df.columns) != self.columns:
+            raise ValueError('Chunk cols differ from the first chunk\'s cols')
+        if len(self.columns) == 0:  # every row is complete, with no patterns to count
+            self.nrows += len(df)
+            self._row_miss_ct_counts[0] += len(df)
+            return self
+        block_rows = max(1, MissingnessAnalyzer.BATCH_MAX_CELLS // max(len(self.columns), 1))
+        for start in range(0, len(df), block_rows):
+            self._update_block(df.iloc[start:start + block_rows].isna().values)
+        return self
+
+    def merge(self, other):
+        """Folds another MissingnessAnalyzer (of other rows, same cols) into this one, returns self"""
+        assert isinstance(other, MissingnessAnalyzer)
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self._reset(other.columns)
+        elif other.columns != self.columns:
+            raise ValueError('Cols differ')
+        self.nrows += other.nrows
+        self._comissing += other._comissing
+        self._row_miss_ct_counts += other._row_miss_ct_counts
+        self._patterns.merge(other._patterns)
+        return self
+
+    def comissing_df(self, normalize=False):
+        """
+        Returns df (cols x cols) of number of rows where both cols are NaN, so the diagonal is each
+        col's miss_ct. If normalize, instead the fraction of the row col's NaNs where the col col
+        is NaN too, ie P(col NaN | row NaN).
+        """
+        counts = self._comissing
+        if normalize:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                counts = counts / np.diag(counts)[:, None]
+        return pd.DataFrame(counts, index=self.columns, columns=self.columns)
+
+    def cols_info(self):
+        """
+        Returns df of info per col: miss_ct, miss_pct, and the other col most often NaN when this
+        one is (most_comissing), with comissing_pct = P(most_comissing NaN | this col NaN)
+        """
+        cond = self.comissing_df(normalize=True).values.copy()
+        np.fill_diagonal(cond, -1)
+        most = np.argmax(cond, axis=1) if len(self.columns) > 1 else np.zeros(len(self.columns), dtype=np.intp)
+        miss_cts = np.diag(self._comissing)
+        has_other = (len(self.columns) > 1) & (miss_cts > 0)
+        return pd.DataFrame(OrderedDict([
+            ('miss_ct', miss_cts), ('miss_pct', miss_cts / max(self.nrows, 1)),
+            ('most_comissing', np.where(has_other, np.array(self.columns, dtype=object)[most], None)),
+            ('comissing_pct', np.where(has_other, cond[np.arange(len(most)), most], np.nan))]),
+            index=pd.Index(self.columns, name='name'))
+
+    def top_patterns(self, n=10):
+        """
+        Returns df of the n most common patterns of which cols are NaN in a row, most common first:
+        rows, rows_pct, miss_ct (number of NaN cols), missing_cols. rows may be short by up to
+        count_error() once there are more distinct patterns than max_patterns.
+        """
+        odicts_lst = []
+        for pattern, count in self._patterns.top(n).items():
+            is_missing = np.unpackbits(np.frombuffer(pattern, dtype=np.uint8), count=len(self.columns)).astype(bool)
+            odicts_lst.append(OrderedDict([
+                ('rows', count), ('rows_pct', count / max(self.nrows, 1)), ('miss_ct', int(is_missing.sum())),
+                ('missing_cols', ', '.join(str(cn) for cn, missing in zip(self.columns, is_missing) if missing))]))
+        return pd.DataFrame(odicts_lst, columns=['rows', 'rows_pct', 'miss_ct', 'missing_cols'])
+
+    def count_error(self):
+        """Max amount top_patterns()' rows may be short by (0 when exact)"""
+        return self._patterns.count_error()
+
+    def row_miss_ct_counts(self):
+        """Series of the number of rows (values) with each number of NaN cols (index)"""
+        return pd.Series(self._row_miss_ct_counts, name='rows').rename_axis('miss_ct')
+
+    def complete_rows_pct(self):
+        return self._row_miss_ct_counts[0] / max(self.nrows, 1)
+
+    def _reset(self, columns):
+        self.columns = columns
+        self._comissing = np.zeros((len(columns), len(columns)), dtype=np.int64)
+        self._row_miss_ct_counts = np.zeros(len(columns) + 1, dtype=np.int64)
+
+    def _update_block(self, mask):
+        if len(mask) == 0:
+            return
+        self.nrows += len(mask)
+        row_bits = np.ascontiguousarray(np.packbits(mask, axis=1))  # (rows, bytes)
+        self._row_miss_ct_counts += np.bincount(_popcount_sum(row_bits), minlength=len(self.columns) + 1)
+        patterns, counts = np.unique(row_bits.view(np.dtype((np.void, row_bits.shape[1]))).ravel(),
+                                     return_counts=True)
+        keep, undercount = sketch.misra_gries_trim(counts, self._patterns.capacity)
+        self._patterns.update_counts(
+            pd.Series(counts[keep] - undercount, index=[pattern.tobytes() for pattern in patterns[keep]]),
+            n=len(mask), undercount=undercount)
+
+        miss_cols = np.flatnonzero(mask.any(axis=0))
+        if len(miss_cols) > 0:
+            self._comissing[np.ix_(miss_cols, miss_cols)] += _comissing_counts(mask[:, miss_cols])
+
+def _comissing_counts(mask):
+    """Same as mask.T @ mask (as int64 counts) for a 2D bool mask, done sparsely when it's mostly False"""
+    n_rows, n_cols = mask.shape
+    row_cts = mask.sum(axis=1)
+    if (row_cts.astype(np.int64) ** 2).sum() * MissingnessAnalyzer.PAIRS_VS_MATMUL > n_rows * n_cols ** 2:
+        bits = mask.astype(np.float32)  # float32 sums are exact, since no count in a block can be over 2 ** 24
+        return np.rint(bits.T @ bits).astype(np.int64)
+
+    # Each NaN pairs up with every NaN in its row (itself too), so count those (col, col) pairs.
+    # np.nonzero() goes row by row, so a row's NaNs are next to each other in cols
+    rows, cols = np.nonzero(mask)
+    row_starts = np.concatenate([[0], np.cumsum(row_cts)[:-1]])[rows]  # where each NaN's row's NaNs start
+    reps = row_cts[rows].astype(np.int64)  # number of pairs each NaN is first in
+    ends = np.cumsum(reps)
+    counts = np.zeros(n_cols * n_cols, dtype=np.int64)
+    start = 0
+    while start < len(cols):
+        stop = max(start + 1, int(np.searchsorted(ends, ends[start] - reps[start] + MissingnessAnalyzer.PAIRS_BATCH,
+                                                  side='right')))
+        batch_reps = reps[start:stop]
+        firsts = np.repeat(cols[start:stop], batch_reps)
+        offsets = np.arange(len(firsts)) - np.repeat(np.cumsum(batch_reps) - batch_reps, batch_reps)
+        seconds = cols[np.repeat(row_starts[start:stop], batch_reps) + offsets]
+        counts += np.bincount(firsts * n_cols + seconds, minlength=n_cols * n_cols)
+        start = stop
+    return counts.reshape(n_cols, n_cols)
+
+POPCOUNT_TABLE = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+def _popcount_sum(bits):
+    """Number of 1 bits in each row of a 2D uint8 array"""
+    if hasattr(np, 'bitwise_count'):  # numpy >= 2
+        return np.bitwise_count(bits).sum(axis=1, dtype=np.int64)
+    return POPCOUNT_TABLE[bits].sum(axis=1, dtype=np.int64)
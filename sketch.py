@@ -0,0 +1,224 @@
+"""
+defnotdatatools.sketch module is for sketches: small, mergeable summaries of data that's too big to
+keep around, eg when profiling a file chunk by chunk. Each sketch has update() to fold in a chunk of
+values and merge() to combine it with another sketch of the same kind, and knows its own error bound.
+
+For how to import, see defnotdatatools/README.md.
+"""
+
+
+
+# < Setup > ============================================================================
+
+import numpy as np
+import pandas as pd
+
+
+
+# < Constants > ===============================================================
+
+QUANTILE_SKETCH_K = 400  # KLL's k: about 3k items kept, rank error ~1.7/k
+DISTINCT_SKETCH_P = 14  # HyperLogLog uses 2**p registers (16KB), rel. std error 1.04/sqrt(2**p)
+HEAVY_HITTERS_CAPACITY = 1000  # number of values (and counts) Misra-Gries keeps
+
+
+
+# < Quantiles > ===============================================================
+
+class QuantileSketch:
+
+    """
+    KLL quantile sketch of floats (NaNs are ignored). Stays exact (keeps every value) until
+    it has seen more than k values, after which it's approximate with rank_error().
+    """
+
+    CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, k=QUANTILE_SKETCH_K, seed=None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]  # items at levels[h] each stand for 2**h original values
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Folds a 1D array of values into the sketch"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """Folds another QuantileSketch into this one"""
+        assert isinstance(other, QuantileSketch)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self._compress()
+
+    def is_exact(self):
+        """True if the sketch still holds every value it has seen"""
+        return len(self.levels) == 1
+
+    def rank_error(self):
+        """Normalized rank error of quantile(): eg 0.005 means within 0.5 pctile points (99% conf.)"""
+        if self.is_exact():
+            return 0.
+        return 2.296 / self.k ** 0.9723  # empirical KLL bound, as published by Apache DataSketches
+
+    def items_and_weights(self):
+        """Returns (items, weights), items sorted, where each item stands for weight values"""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lvl), 2. ** h) for h, lvl in enumerate(self.levels)])
+        order = np.argsort(items, kind='mergesort')
+        return items[order], weights[order]
+
+    def quantile(self, q):
+        """The q quantile (0 <= q <= 1); interpolates like np.percentile while the sketch is exact"""
+        if self.n == 0:
+            return np.nan
+        if self.is_exact():
+            return np.percentile(self.levels[0], q * 100.0)
+        items, weights = self.items_and_weights()
+        return _weighted_quantile(items, weights, q)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * QuantileSketch.CAPACITY_DECAY ** depth)))
+
+    def _compress(self):
+        """Compacts any level over capacity: sorts it and promotes every other item a level up"""
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(self.levels[h])
+                n_leftover = len(items) % 2  # odd item out stays behind at this level
+                offset = self._rng.integers(2)
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], items[n_leftover + offset::2]])
+                self.levels[h] = items[:n_leftover]
+            h += 1
+
+def _weighted_quantile(items, weights, q):
+    """q quantile of sorted items that each stand for weight values"""
+    cum_weights = np.cumsum(weights)
+    idx = np.searchsorted(cum_weights, q * cum_weights[-1], side='left')
+    return items[min(idx, len(items) - 1)]
+
+
+
+# < Distinct counts > ===============================================================
+
+class DistinctSketch:
+
+    """HyperLogLog sketch for counting distinct values (NaNs are ignored)."""
+
+    def __init__(self, p=DISTINCT_SKETCH_P):
+        self.p = p
+        self.registers = np.zeros(2 ** p, dtype=np.uint8)
+
+    def update(self, ser):
+        """Folds the values of a Series (or array-like) into the sketch"""
+        ser = pd.Series(ser).dropna()
+        self.update_hashes(pd.util.hash_pandas_object(ser, index=False).values)
+
+    def update_hashes(self, hashes):
+        """Folds already-hashed values (uint64 array) into the sketch"""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.intp)
+        rest = ((hashes << np.uint64(self.p)) >> np.uint64(32)).astype(np.float64)  # next 32 bits
+        with np.errstate(divide='ignore'):
+            rho = np.where(rest > 0, 32 - np.floor(np.log2(rest)), 33).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rho)
+
+    def merge(self, other):
+        """Folds another DistinctSketch (with the same p) into this one"""
+        assert isinstance(other, DistinctSketch) and other.p == self.p
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        """Estimated number of distinct values"""
+        m = len(self.registers)
+        n_zeros = np.count_nonzero(self.registers == 0)
+        if n_zeros == m:
+            return 0
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(2.0 ** -self.registers.astype(np.float64))
+        if raw <= 2.5 * m and n_zeros > 0:  # small range: linear counting is better
+            return int(round(m * np.log(m / n_zeros)))
+        return int(round(raw))
+
+    def rel_error(self):
+        """Relative standard error of estimate()"""
+        return 1.04 / np.sqrt(len(self.registers))
+
+
+
+# < Most frequent values > ===============================================================
+
+class HeavyHitters:
+
+    """
+    Misra-Gries sketch of the most frequent values and their counts. Counts are exact until
+    more than capacity distinct values have been seen; after that each count may be short by
+    at most count_error().
+    """
+
+    def __init__(self, capacity=HEAVY_HITTERS_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series([], dtype=np.int64)
+        self.n = 0
+        self._undercount = 0
+
+    def update(self, ser):
+        """Folds the values of a Series into the sketch (NaNs are ignored)"""
+        value_counts = pd.Series(ser).value_counts()
+        self.update_counts(value_counts[value_counts > 0])  # categoricals list unused categories too
+
+    def update_counts(self, value_counts, n=None, undercount=0):
+        """
+        Folds a Series of counts indexed by value (eg from value_counts()) into the sketch. If the
+        caller trimmed them first with misra_gries_trim() (to not index every distinct value), n
+        is their total before trimming and undercount is the amount it took off each.
+        """
+        self.n += int(value_counts.sum()) if n is None else int(n)
+        counts = self.counts.add(value_counts, fill_value=0).astype(np.int64)
+        if len(counts) > self.capacity:
+            threshold = counts.nlargest(self.capacity + 1).iloc[-1]
+            counts = counts[counts > threshold] - threshold
+            self._undercount += int(threshold)
+        self._undercount += int(undercount)
+        self.counts = counts
+
+    def merge(self, other):
+        """Folds another HeavyHitters into this one"""
+        assert isinstance(other, HeavyHitters)
+        self._undercount += other._undercount
+        n = self.n + other.n
+        self.update_counts(other.counts)
+        self.n = n
+
+    def is_exact(self):
+        """True if counts (and so the number of distinct values) are exact"""
+        return self._undercount == 0
+
+    def count_error(self):
+        """Max amount any count may be short by (0 when exact)"""
+        return self._undercount
+
+    def top(self, n):
+        """Series of the n most frequent values' counts, most frequent first"""
+        return self.counts.sort_values(ascending=False, kind='mergesort')[:n]
+
+def misra_gries_trim(counts, capacity):
+    """
+    One Misra-Gries step on a 1D array of counts: returns (bool mask of the at most capacity
+    counts to keep, amount to take off each kept count), for HeavyHitters.update_counts()
+    """
+    if len(counts) <= capacity:
+        return np.ones(len(counts), dtype=bool), 0
+    threshold = np.partition(counts, len(counts) - capacity - 1)[len(counts) - capacity - 1]
+    return counts > threshold, threshold
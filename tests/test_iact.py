@@ -0,0 +1,81 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from .. import iact
+
+
+def _cols_info_float_per_col(df):
+    """cols_info_float() as it was built before float_block_info(): ser_info_any() + ser_info_float() per col"""
+    odicts_lst = []
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # Series.mad() is deprecated
+        for cn, ser in df.select_dtypes(['float']).items():
+            odict = iact.ser_info_any(ser)
+            odict.update(iact.ser_info_float(ser))
+            odicts_lst.append(odict)
+    return pd.DataFrame(odicts_lst, columns=odicts_lst[0].keys()).set_index('name')
+
+def _float_df(n_rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'normal': rng.normal(size=n_rows), 'skewed': rng.exponential(size=n_rows),
+                       'ints': rng.integers(0, 5, n_rows).astype(np.float64), 'text': 'x'})
+    df.loc[df.index[::7], 'normal'] = np.nan
+    df['all_nan'] = np.nan
+    df['with_inf'] = np.where(np.arange(n_rows) == 3, np.inf, rng.normal(size=n_rows))
+    return df
+
+def test_cols_info_float_matches_per_col():
+    df = _float_df()
+    got = iact.cols_info_float(df)
+    expected = _cols_info_float_per_col(df)
+    pd.testing.assert_frame_equal(got[expected.columns], expected, check_dtype=False, rtol=1e-9)
+
+@pytest.mark.parametrize('n_jobs, executor', [(1, 'thread'), (3, 'thread'), (2, 'process')])
+def test_cols_info_float_same_for_any_n_jobs(n_jobs, executor, monkeypatch):
+    monkeypatch.setattr(iact, 'FLOAT_BATCH_MAX_CELLS', 1000)  # several batches
+    df = _float_df()
+    pd.testing.assert_frame_equal(iact.cols_info_float(df, n_jobs=n_jobs, executor=executor),
+                                  iact.cols_info_float(df))
+
+def test_cols_info_float_inf_like_pandas():
+    df = pd.DataFrame({'a': [1, 2, np.inf], 'b': [1, np.inf, -np.inf]})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        got = iact.cols_info_float(df)
+    assert got.loc['a', 'MAD'] == np.inf
+    assert got.loc['a', 'mean'] == np.inf
+    assert np.isnan(got.loc['b', 'MAD'])
+
+def test_df_fingerprint():
+    df = _float_df()
+    assert iact.df_fingerprint(df) == iact.df_fingerprint(df.copy())
+    assert iact.df_fingerprint(df) != iact.df_fingerprint(df.rename_axis('idx'))
+    changed = df.copy()
+    changed.iloc[0, 1] += 1
+    assert iact.df_fingerprint(df) != iact.df_fingerprint(changed)
+
+def test_df_full_info_parquet_round_trip(tmp_path):
+    pytest.importorskip('pyarrow')
+    df = _float_df()
+    df['when'] = pd.date_range('2020-01-01', periods=len(df), freq='h')
+    df['flag'] = df['ints'] > 2
+    info = iact.df_full_info(df, name='test')
+    path = str(tmp_path / 'info.parquet')
+    info.to_parquet(path)
+    loaded = iact.DFFullInfo.construct_from_parquet(path)
+    assert loaded.name == 'test'
+    pd.testing.assert_frame_equal(loaded.df_summary, info.df_summary)
+    pd.testing.assert_frame_equal(loaded.df_cols_float, info.df_cols_float)
+    pd.testing.assert_frame_equal(loaded.df_cols_other, info.df_cols_other)
+
+def test_sampled_df_full_info_exact_minmax():
+    df = _float_df(n_rows=20000)
+    info = iact.df_full_info(df, sample_rows=1000, seed=0)
+    assert (info.df_approx['sample_rows'] == 1000).all()
+    assert info.df_cols_float.loc['normal', 'min'] == df['normal'].min()
+    assert info.df_cols_float.loc['normal', 'miss_ct'] == df['normal'].isna().sum()
+    approx = info.df_approx.loc['skewed']
+    assert approx['mean_lo'] <= df['skewed'].mean() <= approx['mean_hi']
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from .. import missing
+
+
+def _df_with_nans(n_rows=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'group': rng.integers(0, 4, n_rows), 'a': rng.normal(size=n_rows),
+                       'b': rng.exponential(size=n_rows), 'c': np.nan, 'text': 'x'})
+    df.loc[rng.random(n_rows) < .2, 'a'] = np.nan
+    df.loc[rng.random(n_rows) < .3, 'b'] = np.nan
+    return df
+
+def test_median_filler_matches_tfrm_fill_median():
+    df = _df_with_nans()
+    pd.testing.assert_frame_equal(missing.tfrm_fill_median_df(df), df.apply(missing.tfrm_fill_median))
+
+def test_median_filler_duplicate_col_names():
+    df = pd.DataFrame([[1., np.nan], [np.nan, 10.], [3., 30.]], columns=['x', 'x'])
+    filled = missing.MedianFiller().fit_transform(df)
+    np.testing.assert_array_equal(filled.values, [[1., 20.], [2., 10.], [3., 30.]])
+
+def test_group_median_filler_matches_groupby_median():
+    df = _df_with_nans()
+    filled = missing.tfrm_fill_median_by_group(df, by='group')
+    for cn in ('a', 'b'):
+        expected = df[cn].fillna(df.groupby('group')[cn].transform('median'))
+        pd.testing.assert_series_equal(filled[cn], expected)
+    assert (filled['c'] == 0).all()
+
+def test_group_median_filler_partial_fit_exact_for_small_groups():
+    df = _df_with_nans()  # groups of ~250 rows, under SAMPLE_SIZE
+    filler = missing.GroupMedianFiller(by='group', seed=0)
+    for start in range(0, len(df), 300):
+        filler.partial_fit(df.iloc[start:start + 300])
+    chunked = filler.transform(df)
+    pd.testing.assert_frame_equal(chunked, missing.tfrm_fill_median_by_group(df, by='group'))
+
+def test_chunked_fill_leaves_chunks_alone():
+    df = _df_with_nans()
+    chunks = [df.iloc[start:start + 300].copy() for start in range(0, len(df), 300)]
+    filled = list(missing.tfrm_fill_median_by_group_chunked(lambda: chunks, by='group'))
+    assert sum(chunk.isna().sum().sum() for chunk in chunks) == df.isna().sum().sum()
+    assert all(chunk[['a', 'b', 'c']].notna().all().all() for chunk in filled)
+
+def test_missingness_analyzer_counts():
+    df = _df_with_nans()
+    analyzer = missing.analyze_missingness(df.iloc[i:i + 300] for i in range(0, len(df), 300))
+    isna = df.isna().astype(np.int64)
+    np.testing.assert_array_equal(analyzer.comissing_df().values, isna.T.dot(isna).values)
+    row_miss_ct_counts = analyzer.row_miss_ct_counts()
+    assert row_miss_ct_counts[row_miss_ct_counts > 0].to_dict() == isna.sum(axis=1).value_counts().to_dict()
+    assert analyzer.top_patterns(1)['rows'].iloc[0] == isna.value_counts().iloc[0]
+    assert analyzer.count_error() == 0
+
+def test_missingness_analyzer_no_cols():
+    analyzer = missing.analyze_missingness(pd.DataFrame(index=range(5)))
+    assert analyzer.comissing_df().empty
+    assert analyzer.top_patterns().empty
+    assert analyzer.complete_rows_pct() == 1
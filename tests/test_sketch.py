@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from .. import sketch
+
+
+def test_quantile_sketch_within_rank_error():
+    values = np.random.default_rng(0).normal(size=100000)
+    quantiles = sketch.QuantileSketch(seed=0)
+    for chunk in np.array_split(values, 10):
+        quantiles.update(chunk)
+    assert not quantiles.is_exact()
+    sorted_values = np.sort(values)
+    for q in (.05, .25, .5, .75, .95):
+        rank = np.searchsorted(sorted_values, quantiles.quantile(q)) / len(values)
+        assert abs(rank - q) <= quantiles.rank_error()
+
+def test_quantile_sketch_exact_when_small():
+    values = np.arange(100.)
+    quantiles = sketch.QuantileSketch()
+    quantiles.update(values)
+    assert quantiles.quantile(.3) == np.percentile(values, 30)
+
+def test_distinct_sketch_within_rel_error():
+    distinct = sketch.DistinctSketch()
+    distinct.update(pd.Series(np.arange(50000)))
+    distinct.update(pd.Series(np.arange(25000, 75000)))  # overlapping, so 75000 distinct
+    assert abs(distinct.estimate() / 75000 - 1) <= 3 * distinct.rel_error()
+
+def test_heavy_hitters_within_count_error():
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.zipf(1.5, 100000))
+    heavy = sketch.HeavyHitters(capacity=50)
+    for start in range(0, len(values), 10000):
+        heavy.update(values.iloc[start:start + 10000])
+    true_counts = values.value_counts()
+    top = heavy.top(10)
+    assert heavy.count_error() > 0
+    assert heavy.n == len(values)
+    for value, count in top.items():
+        assert true_counts[value] - heavy.count_error() <= count <= true_counts[value]
+    assert list(top.index[:3]) == list(true_counts.index[:3])
+
+def test_misra_gries_trim_keeps_bound():
+    counts = np.array([50, 1, 30, 2, 2, 9])
+    keep, undercount = sketch.misra_gries_trim(counts, 3)
+    assert keep.sum() <= 3 and undercount == 2
+    heavy = sketch.HeavyHitters(capacity=3)
+    heavy.update_counts(pd.Series(counts[keep] - undercount, index=np.flatnonzero(keep)),
+                        n=counts.sum(), undercount=undercount)
+    assert heavy.n == counts.sum() and heavy.count_error() == 2
+    assert heavy.top(1).iloc[0] >= 50 - heavy.count_error()
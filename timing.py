@@ -7,12 +7,28 @@ For how to import, see defnotdatatools/README.md.
 
 # < Setup > ============================================================================
 
+import collections
+import contextvars
+import functools
+import os
+import random
+import sys
+import threading
 import time
+import weakref
 
 
 
 # < Constants > ===============================================================
 
+SPAN_SAMPLES_MAX = 1024  # per span name per thread, durations kept (reservoir sampled) for percentiles
+SPAN_PCTILES = (50, 90, 99)
+SPAN_EVENTS_MAX = 100000  # default size of the ring buffer of span events, see Timer.record_events()
+
+# Innermost open span in this thread / asyncio task, as (timer, span path, enclosing frame), or None.
+# One ContextVar for all Timers (a ContextVar is never freed), looked up by timer along the frames
+SPAN_FRAME = contextvars.ContextVar('span_frame', default=None)
+
 
 
 # < Datetime items > ===============================================================
@@ -37,7 +53,25 @@ def now_for_str(date_only=False):
 
 class Timer:
 
-    """Timer class for timing how long parts of your code take."""
+    """
+    Timer class for timing how long parts of your code take.
+
+    Besides the check_ methods (time since the timer was started), it times named spans of code:
+        with timer.span('load'):
+            with timer.span('parse'):  # nested, so it's recorded as 'load/parse'
+                ...
+        @timer.timed()  # or timer.timed('name'); also works on async fns
+        def fn(): ...
+    then span_stats() or span_report() give each span's call count and total/min/max/percentile
+    times. Spans nest separately per thread and per asyncio task, and each thread records into
+    its own stats, so there's no locking (stats of threads that have ended are merged together
+    and dropped). A span costs about 2.5 microseconds (CPython 3.11, measured as a with block
+    around pass), so they can stay in all but the tightest loops.
+
+    To see individual runs rather than just stats, record_events() keeps each span's start, end,
+    thread, task, and attributes (span(name, **attrs)) in a ring buffer of the latest max_events,
+    which to_chrome_trace() (for Perfetto or chrome://tracing) or to_jsonl() write out.
+    """
 
     ENOUGH_SECS_TO_USE_MINS = 120
     ENOUGH_SECS_TO_USE_HRS = 120 * 60
@@ -45,8 +79,16 @@ class Timer:
 
     def __init__(self, name=''):
         """Creates and starts timer"""
-        self._time_created = time.time()
+        self.name = name
+        self._time_created = time.time()  # wall clock, for display
         self._time_restarted = self._time_created
+        self._ns_restarted = time.perf_counter_ns()  # monotonic, for timing
+        self._ns_created = self._ns_restarted
+        self._span_events = None  # deque of span events, while record_events() is on
+        self._thread_local = threading.local()
+        self._threads_span_stats = []  # (weakref to thread, its dict of span path -> [count, total, min, max, samples])
+        self._ended_threads_span_stats = {}  # the same dict, merged from threads that have ended
+        self._threads_span_stats_lock = threading.Lock()
 
     @classmethod
     def construct_historical_timer(cls, time_created, time_restarted=None):
@@ -54,6 +96,7 @@ class Timer:
         new_timer = Timer()
         new_timer._time_created = time_created
         new_timer._time_restarted = time_restarted
+        new_timer._ns_restarted = None  # so checks use the wall clock, since that's all we have
         return new_timer
 
     def __repr__(self):
@@ -70,6 +113,7 @@ class Timer:
     def start(self):
         """Starts timer (technically it's a restart, since timer is always considered running)"""
         self._time_restarted = time.time()
+        self._ns_restarted = time.perf_counter_ns()
 
     def check_num(self, units='mins'):
         """Returning time since start, using passed units arg: 'secs' | 'mins' (default) | 'hrs' """
@@ -78,12 +122,14 @@ class Timer:
                          'hrs': 60*60}
         if units not in DIVIDEBY_DICT:
             raise KeyError("You gave an invalid units arg" + units)
-        return (time.time() - self._time_restarted) / DIVIDEBY_DICT[units]
+        if self._ns_restarted is None:
+            return (time.time() - self._time_restarted) / DIVIDEBY_DICT[units]
+        return (time.perf_counter_ns() - self._ns_restarted) / 1e9 / DIVIDEBY_DICT[units]
 
     def check_num_and_start(self, units='mins'):
         """Checks (returning number) and starts timer"""
         ret = self.check_num(units=units)
-        self._time_restarted = time.time()
+        self.start()
         return ret
 
     def cnums(self, units='mins'):
@@ -107,9 +153,255 @@ class Timer:
     def check_str_and_start(self, units='auto'):
         """Checks (returning str) and starts timer"""
         ret = self.check_str(units=units)
-        self._time_restarted = time.time()
+        self.start()
         return ret
 
     def css(self, units='auto'):
         """Shortcut alias for check_str_and_start()"""
         return self.check_str_and_start(units=units)
+
+    def span(self, name, **attrs):
+        """
+        Returns context manager that times the code in its with block as span name. attrs (eg
+        batch=i) are kept with the span's event if record_events() is on.
+        """
+        return _Span(self, name, attrs)
+
+    def timed(self, name=None):
+        """Returns decorator that times each call of a fn (or async fn) as span name (default: fn's name)"""
+        import inspect  # here rather than at the top, so importing timing stays quick
+        def decorator(fn):
+            span_name = fn.__qualname__ if name is None else name
+            if inspect.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def timed_fn(*args, **kwargs):
+                    with _Span(self, span_name, None):
+                        return await fn(*args, **kwargs)
+            else:
+                @functools.wraps(fn)
+                def timed_fn(*args, **kwargs):
+                    with _Span(self, span_name, None):
+                        return fn(*args, **kwargs)
+            return timed_fn
+        return decorator
+
+    def span_stats(self, units='secs'):
+        """
+        Returns dict of span path -> dict of its count, total, mean, min, max, and pNN percentiles
+        (from up to SPAN_SAMPLES_MAX durations per thread), in passed units: 'ns' | 'secs' | 'mins'
+        """
+        DIVIDEBY_DICT = {'ns': 1,
+                         'secs': 1e9,
+                         'mins': 60e9}
+        if units not in DIVIDEBY_DICT:
+            raise KeyError("You gave an invalid units arg" + units)
+        merged = {}
+        with self._threads_span_stats_lock:
+            self._merge_ended_threads()
+            _merge_span_stats(merged, self._ended_threads_span_stats)
+            threads_span_stats = [span_stats for _, span_stats in self._threads_span_stats]
+        for span_stats in threads_span_stats:
+            _merge_span_stats(merged, span_stats)
+        ret = {}
+        for path in sorted(merged):
+            count, total, min_ns, max_ns, samples = merged[path]
+            samples.sort()
+            stats = {'count': count,
+                     'total': total / DIVIDEBY_DICT[units],
+                     'mean': total / count / DIVIDEBY_DICT[units],
+                     'min': min_ns / DIVIDEBY_DICT[units],
+                     'max': max_ns / DIVIDEBY_DICT[units]}
+            for pctile in SPAN_PCTILES:
+                idx = min(len(samples) - 1, int(pctile / 100 * len(samples)))
+                stats['p' + str(pctile)] = samples[idx] / DIVIDEBY_DICT[units]
+            ret[path] = stats
+        return ret
+
+    def span_report(self, units='secs'):
+        """Returns str table of span_stats(), one line per span, nested spans indented"""
+        stats_dict = self.span_stats(units=units)
+        stat_names = ['count', 'total', 'mean', 'min', 'max'] + ['p' + str(pctile) for pctile in SPAN_PCTILES]
+        name_width = max([len(path) for path in stats_dict] + [len('span')]) + 2
+        lines = ['span'.ljust(name_width) + ''.join(stat_name.rjust(12) for stat_name in stat_names)]
+        for path, stats in stats_dict.items():
+            depth = path.count('/')
+            line = ('  ' * depth + path.split('/')[-1]).ljust(name_width) + str(stats['count']).rjust(12)
+            line += ''.join('{:12.{}g}'.format(stats[stat_name], 4) for stat_name in stat_names[1:])
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def reset_spans(self):
+        """Forgets all span stats recorded so far"""
+        with self._threads_span_stats_lock:
+            self._merge_ended_threads()
+            self._ended_threads_span_stats.clear()
+            for _, span_stats in self._threads_span_stats:
+                span_stats.clear()
+
+    def record_events(self, max_events=SPAN_EVENTS_MAX):
+        """Starts keeping each span's event, in a ring buffer of the latest max_events"""
+        self._span_events = collections.deque(maxlen=max_events)
+
+    def stop_recording_events(self):
+        """Stops keeping span events (and forgets the ones kept)"""
+        self._span_events = None
+
+    def span_events(self):
+        """
+        Returns list of dicts, one per recorded span event, oldest first, with: name, path (incl.
+        parent spans), start_ns and end_ns (since timer was created), dur_ns, start_unix (secs),
+        thread, task (asyncio task name or None), attrs
+        """
+        if self._span_events is None:
+            return []
+        events = []
+        for path, start_ns, end_ns, thread_name, task_name, attrs in list(self._span_events):
+            events.append({'name': path.split('/')[-1],
+                           'path': path,
+                           'start_ns': start_ns - self._ns_created,
+                           'end_ns': end_ns - self._ns_created,
+                           'dur_ns': end_ns - start_ns,
+                           'start_unix': self._time_created + (start_ns - self._ns_created) / 1e9,
+                           'thread': thread_name,
+                           'task': task_name,
+                           'attrs': attrs or {}})
+        return events
+
+    def to_chrome_trace(self, full_file_path):
+        """
+        Writes recorded span events to file as Chrome trace-event JSON, to open in Perfetto
+        (ui.perfetto.dev) or chrome://tracing. Each thread, and each asyncio task, gets its own track.
+        """
+        track_ids = collections.OrderedDict()  # (thread, task) -> tid
+        trace_events = []
+        for event in self.span_events():
+            track = (event['thread'], event['task'])
+            if track not in track_ids:
+                track_ids[track] = len(track_ids) + 1
+            trace_events.append({'name': event['name'], 'cat': event['path'], 'ph': 'X',
+                                 'ts': event['start_ns'] / 1000, 'dur': event['dur_ns'] / 1000,
+                                 'pid': os.getpid(), 'tid': track_ids[track],
+                                 'args': {k: _jsonable(v) for k, v in event['attrs'].items()}})
+        for (thread_name, task_name), tid in track_ids.items():
+            track_name = thread_name if task_name is None else thread_name + ' / ' + task_name
+            trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+                                 'args': {'name': track_name}})
+        import json
+        with open(full_file_path, 'w') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+
+    def to_jsonl(self, full_file_path):
+        """Writes recorded span events to file as JSON Lines, one span_events() dict per line"""
+        import json
+        with open(full_file_path, 'w') as f:
+            for event in self.span_events():
+                event['attrs'] = {k: _jsonable(v) for k, v in event['attrs'].items()}
+                f.write(json.dumps(event) + '\n')
+
+    def _record_span(self, path, elapsed_ns):
+        """Adds a span's duration to this thread's stats (no lock needed: only this thread writes them)"""
+        try:
+            span_stats = self._thread_local.span_stats
+        except AttributeError:
+            span_stats = self._thread_local.span_stats = {}
+            with self._threads_span_stats_lock:
+                self._merge_ended_threads()  # here too, so threads coming and going don't pile up stats
+                self._threads_span_stats.append((weakref.ref(threading.current_thread()), span_stats))
+        stats = span_stats.get(path)
+        if stats is None:
+            span_stats[path] = [1, elapsed_ns, elapsed_ns, elapsed_ns, [elapsed_ns]]
+            return
+        stats[0] += 1
+        stats[1] += elapsed_ns
+        if elapsed_ns < stats[2]:
+            stats[2] = elapsed_ns
+        elif elapsed_ns > stats[3]:
+            stats[3] = elapsed_ns
+        samples = stats[4]
+        if len(samples) < SPAN_SAMPLES_MAX:
+            samples.append(elapsed_ns)
+        else:  # reservoir sampling, so samples stay a uniform sample of all durations
+            idx = int(random.random() * stats[0])
+            if idx < SPAN_SAMPLES_MAX:
+                samples[idx] = elapsed_ns
+
+    def _merge_ended_threads(self):
+        """Merges stats of threads that have ended into _ended_threads_span_stats (call with the lock held)"""
+        live = []
+        for thread_ref, span_stats in self._threads_span_stats:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live.append((thread_ref, span_stats))
+            else:
+                _merge_span_stats(self._ended_threads_span_stats, span_stats)
+        self._threads_span_stats = live
+
+def _merge_span_stats(into, span_stats):
+    """
+    Adds a dict of span path -> [count, total, min, max, samples] into another, keeping at most
+    SPAN_SAMPLES_MAX samples per path, drawn from each side in proportion to its count
+    """
+    for path, (count, total, min_ns, max_ns, samples) in list(span_stats.items()):
+        stats = into.get(path)
+        if stats is None:
+            into[path] = [count, total, min_ns, max_ns, list(samples)]
+            continue
+        if len(stats[4]) + len(samples) > SPAN_SAMPLES_MAX:
+            n_from_into = min(len(stats[4]), round(SPAN_SAMPLES_MAX * stats[0] / (stats[0] + count)))
+            n_from_into = max(n_from_into, SPAN_SAMPLES_MAX - len(samples))
+            stats[4] = random.sample(stats[4], n_from_into) + random.sample(samples, SPAN_SAMPLES_MAX - n_from_into)
+        else:
+            stats[4] = stats[4] + samples
+        stats[0] += count
+        stats[1] += total
+        stats[2] = min(stats[2], min_ns)
+        stats[3] = max(stats[3], max_ns)
+
+
+class _Span:
+
+    """Context manager made by Timer.span()"""
+
+    __slots__ = ('_timer', '_name', '_attrs', '_token', '_path', '_start_ns')
+
+    def __init__(self, timer, name, attrs):
+        self._timer = timer
+        self._name = name
+        self._attrs = attrs
+
+    def __enter__(self):
+        timer = self._timer
+        frame = top = SPAN_FRAME.get()
+        while frame is not None and frame[0] is not timer:  # spans of other timers don't nest into this one's
+            frame = frame[2]
+        path = self._name if frame is None else frame[1] + '/' + self._name
+        self._token = SPAN_FRAME.set((timer, path, top))
+        self._path = path
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed_ns = time.perf_counter_ns() - self._start_ns
+        SPAN_FRAME.reset(self._token)
+        path = self._path
+        self._timer._record_span(path, elapsed_ns)
+        span_events = self._timer._span_events
+        if span_events is not None:  # deque.append() is thread-safe
+            span_events.append((path, self._start_ns, self._start_ns + elapsed_ns,
+                                threading.current_thread().name, _current_task_name(), self._attrs))
+        return False
+
+def _current_task_name():
+    """Name of the running asyncio task, or None if not in one"""
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is None:  # never imported, so no task can be running (and importing it is slow)
+        return None
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:  # no running event loop
+        return None
+    return None if task is None else task.get_name()
+
+def _jsonable(val):
+    """val if json can write it, else its str()"""
+    return val if isinstance(val, (str, int, float, bool, type(None))) else str(val)